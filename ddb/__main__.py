@@ -8,7 +8,8 @@ import threading
 from argparse import ArgumentParser, Namespace
 from gettext import gettext as _
 from importlib import import_module
-from typing import Optional, Sequence, Iterable, Callable, Union, List
+from operator import attrgetter
+from typing import Optional, Sequence, Iterable, Callable, Union, List, Tuple
 
 import verboselogs
 from colorlog import default_log_colors, ColoredFormatter
@@ -90,20 +91,24 @@ def register_default_caches():
     register_global_cache(requests_cache_name)
 
 
-def register_objects(features_list: Iterable[Feature],
-                     objects_getter: Callable[[Feature], Iterable[RegistryObject]],
-                     registry: Registry[RegistryObject]):
+def register_objects(features_list: Sequence[Feature],
+                     *registrations: Tuple[Callable[[Feature], Iterable[RegistryObject]], Registry[RegistryObject]]):
     """
-    Register objects from features inside registry.
+    Register objects from features inside registries. Each registration is a tuple of an objects getter and the
+    registry to register objects into.
+
+    Registrations are processed in order, as objects may rely on objects registered by previous registrations
+    (commands are bound to phases for instance). features_list is iterated for each registration.
     """
-    all_objects = []
+    for objects_getter, registry in registrations:
+        all_objects = []
+        _extend = all_objects.extend
 
-    for feature in features_list:
-        objects = objects_getter(feature)
-        all_objects.extend(objects)
+        for feature in features_list:
+            _extend(objects_getter(feature))
 
-    for obj in all_objects:
-        registry.register(obj)
+        for obj in all_objects:
+            registry.register(obj)
 
 
 def preload_registered_features():
@@ -112,9 +117,10 @@ def preload_registered_features():
     """
     load_bootstrap_config()
     all_features = features.all()
-    enabled_features = [f for f in all_features if not f.disabled]  # type: Iterable[Feature]
-    register_objects(enabled_features, lambda f: f.phases, phases)
-    register_objects(enabled_features, lambda f: f.commands, commands)
+    enabled_features = [f for f in all_features if not f.disabled]  # type: Sequence[Feature]
+    register_objects(enabled_features,
+                     (lambda f: f.phases, phases),
+                     (lambda f: f.commands, commands))
     return enabled_features
 
 
@@ -142,15 +148,18 @@ def load_registered_features(preload=True):
 
     # migrations.compat(config.data)
 
-    enabled_features = [f for f in all_features if not f.disabled]  # type: Iterable[Feature]
+    enabled_features = [f for f in all_features if not f.disabled]  # type: Sequence[Feature]
 
+    registrations = []
     if preload:
-        register_objects(enabled_features, lambda f: f.phases, phases)
-        register_objects(enabled_features, lambda f: f.commands, commands)
+        registrations.append((lambda f: f.phases, phases))
+        registrations.append((lambda f: f.commands, commands))
+
+    registrations.append((lambda f: [a for a in f.actions if not a.disabled], actions))
+    registrations.append((lambda f: f.binaries, binaries))
+    registrations.append((lambda f: f.services, services))
 
-    register_objects(enabled_features, lambda f: [a for a in f.actions if not a.disabled], actions)
-    register_objects(enabled_features, lambda f: f.binaries, binaries)
-    register_objects(enabled_features, lambda f: f.services, services)
+    register_objects(enabled_features, *registrations)
 
     for feature in enabled_features:
         feature.after_load()
@@ -236,6 +245,15 @@ class ParseCommandLineException(Exception):
         self.unknown_args = unknown_args
 
 
+def _find_command_name(args: Sequence[str]) -> Optional[str]:
+    for arg in args:
+        if arg == '--':
+            break
+        if not arg.startswith('-'):
+            return arg
+    return None
+
+
 def parse_command_line(args: Optional[Sequence[str]] = None):
     """
     Parse command line arguments, returning the command to execute, args and unknown args.
@@ -264,13 +282,15 @@ def parse_command_line(args: Optional[Sequence[str]] = None):
                       help="Stop on first error")
     opts.add_argument('--version', action="store_true", help='Display the ddb version and check for new ones.')
 
-    command_parsers = {}
+    # Global options are all flags, so the first positional argument is the command name. Only its parser is
+    # configured, other commands parsers are only added to be listed in usage.
+    command_name = _find_command_name(sys.argv[1:] if args is None else args)
 
     subparsers = opts.add_subparsers(dest="command", help='Available commands')
     for command in commands.all():
         parser = command.add_parser(subparsers)
-        command.configure_parser(parser)
-        command_parsers[command.name] = parser
+        if command.name == command_name:
+            command.configure_parser(parser)
 
     parsed_args, unknown_args = opts.parse_known_args(args)
 
@@ -306,9 +326,9 @@ def handle_command_line(command: Command):
         handle_watch()
 
 
-def _register_action_in_event_bus(action: Action, binding: Union[Callable, str, EventBinding], fail_fast=False):
+def _normalize_event_binding(binding: Union[Callable, str, EventBinding]) -> EventBinding:
     """
-    Register a single event binding. It supports name property added by @event decorator on events callable.
+    Normalize a single event binding. It supports name property added by @event decorator on events callable.
     """
     if callable(binding) and hasattr(binding, "name"):
         binding = binding.name
@@ -316,26 +336,27 @@ def _register_action_in_event_bus(action: Action, binding: Union[Callable, str,
         binding = EventBinding(binding)
     if callable(binding.event) and hasattr(binding.event, "name"):
         binding.event = binding.event.name
-
-    bus.on(binding.event, action_event_binding_runner_factory(action,
-                                                              binding.event,
-                                                              to_call=binding.call,
-                                                              event_processor=binding.processor,
-                                                              fail_fast=fail_fast).run)
+    return binding
 
 
 def register_actions_in_event_bus(fail_fast=False):
     """
     Register actions into event bus.
     """
-    sorted_actions = sorted(actions.all(), key=lambda x: x.order)
+    action_bindings = []
+    for action in sorted(actions.all(), key=attrgetter('order')):
+        event_bindings = action.event_bindings
+        if isinstance(event_bindings, (str, EventBinding)) or callable(event_bindings):
+            event_bindings = (event_bindings,)
+        action_bindings.extend((action, _normalize_event_binding(binding)) for binding in event_bindings)
 
-    for action in sorted_actions:
-        if isinstance(action.event_bindings, (str, EventBinding)) or callable(action.event_bindings):
-            _register_action_in_event_bus(action, action.event_bindings, fail_fast)
-        else:
-            for event_binding in action.event_bindings:
-                _register_action_in_event_bus(action, event_binding, fail_fast)
+    _on = bus.on
+    for action, binding in action_bindings:
+        _on(binding.event, action_event_binding_runner_factory(action,
+                                                               binding.event,
+                                                               to_call=binding.call,
+                                                               event_processor=binding.processor,
+                                                               fail_fast=fail_fast).run)
 
 
 def main(args: Optional[Sequence[str]] = None,  # pylint:disable=too-many-statements
@@ -432,6 +453,9 @@ def clear_caches():
     Clear all caches
     """
     for cache in caches.all():
+        if len(cache) == 0:
+            # Avoid writing empty caches to persistent storage.
+            continue
         cache.clear()
         cache.flush()
 
@@ -1,9 +1,10 @@
 # -*- coding: utf-8 -*-
+import re
+from functools import lru_cache
 from uuid import uuid4
 
-from slugify import slugify
-
 from .cache import Cache
+from .disk_cache import DiskCache
 from .shelve_cache import ShelveCache
 from ..config import config
 from ..registry import Registry
@@ -16,10 +17,22 @@ requests_cache_name = 'requests'
 project_cache_name = 'project'
 project_binary_cache_name = 'binary'
 
+_namespace_invalid_chars_regex = re.compile(r'[^-a-z0-9_\.]+')
+_namespace_duplicate_dashes_regex = re.compile(r'-{2,}')
+
+
+@lru_cache(maxsize=None)
+def _slugify_namespace(name: str) -> str:
+    """
+    Convert a cache name into a filesystem safe namespace.
+    """
+    namespace = _namespace_invalid_chars_regex.sub('-', name.lower())
+    return _namespace_duplicate_dashes_regex.sub('-', namespace).strip('-')
+
 
 def register_project_cache(cache_name):
     """
-    Creates a ShelveCache for current project, and register it with given name.
+    Creates a DiskCache for current project, and register it with given name.
     """
     registered_projects_cache_name = ShelveCache('project-cache-uuid', eternal=True)
     try:
@@ -31,7 +44,7 @@ def register_project_cache(cache_name):
         registered_projects_cache_name.close()
 
     namespace = [item for item in (project_cache_uuid, cache_name) if item]
-    cache = ShelveCache(slugify('.'.join(namespace), regex_pattern=r'[^-a-z0-9_\.]+'))
+    cache = DiskCache(_slugify_namespace('.'.join(namespace)))
 
     caches.register(cache, cache_name)
     return cache
@@ -39,9 +52,9 @@ def register_project_cache(cache_name):
 
 def register_global_cache(cache_name):
     """
-    Creates a ShelveCache shared for all projects, and register it with given name.
+    Creates a DiskCache shared for all projects, and register it with given name.
     """
-    cache = ShelveCache(slugify(cache_name, regex_pattern=r'[^-a-z0-9_\.]+'))
+    cache = DiskCache(_slugify_namespace(cache_name))
     caches.register(cache, cache_name)
     return cache
 
@@ -50,6 +50,18 @@ class Cache(ABC):
         Synchronize the cache with persistent system.
         """
 
+    @abstractmethod
+    def __len__(self):
+        """
+        Get the number of cache entries.
+        """
+
+    def __bool__(self):
+        """
+        A cache instance is always truthy, even when empty.
+        """
+        return True
+
     def __contains__(self, key):
         """
         Check if key exists.
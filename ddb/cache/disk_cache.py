@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+import os
+import shutil
+import tempfile
+
+import diskcache
+
+from .cache import Cache
+from ..config import config
+
+_missing = object()
+
+
+class DiskCache(Cache):
+    """
+    A cache implementation relying on diskcache module, backed by SQLite.
+    """
+
+    def __init__(self, namespace: str, eternal=False):
+        super().__init__(namespace)
+
+        clear_cache = config.clear_cache and not eternal
+
+        if config.paths.home:
+            path = os.path.join(config.paths.home, "cache")
+        else:
+            path = os.path.join(tempfile.gettempdir(), "ddb", "cache")
+        os.makedirs(path, exist_ok=True)
+
+        self.directory = os.path.join(path, self._namespace + ".diskcache")
+        if clear_cache:
+            self._delete_directory(self.directory)
+        try:
+            self._cache = diskcache.Cache(self.directory)
+        except Exception as open_error:  # pylint:disable=broad-except
+            if self._delete_directory(self.directory):
+                try:
+                    self._cache = diskcache.Cache(self.directory)
+                except Exception as fallback_error:  # pylint:disable=broad-except
+                    raise open_error from fallback_error
+            else:
+                raise open_error
+        self._closed = False
+
+    @staticmethod
+    def _delete_directory(directory):
+        if os.path.exists(directory):
+            shutil.rmtree(directory, ignore_errors=True)
+            return True
+        return False
+
+    def _check_opened(self):
+        if self._closed:
+            raise ValueError("invalid operation on closed cache")
+
+    def close(self):
+        self._cache.close()
+        self._closed = True
+
+    def flush(self):
+        self._check_opened()
+
+    def get(self, key: str, default=None):
+        self._check_opened()
+        try:
+            return self._cache.get(key, default)
+        except AttributeError:
+            # This can occur when class definition hash change.
+            self._cache.clear()
+            raise
+
+    def keys(self):
+        self._check_opened()
+        return list(self._cache.iterkeys())
+
+    def set(self, key: str, data):
+        self._check_opened()
+        self._cache.set(key, data)
+
+    def pop(self, key: str):
+        self._check_opened()
+        try:
+            value = self._cache.pop(key, _missing)
+        except AttributeError:
+            # This can occur when class definition hash change.
+            self._cache.clear()
+            raise
+        if value is _missing:
+            raise KeyError(key)
+        return value
+
+    def clear(self):
+        self._check_opened()
+        self._cache.clear()
+
+    def __len__(self):
+        self._check_opened()
+        return len(self._cache)
+
+    def __contains__(self, key):
+        self._check_opened()
+        return key in self._cache
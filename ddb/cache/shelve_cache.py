@@ -94,5 +94,8 @@ class ShelveCache(Cache):
             self._delete_files(self.basename)
             raise
 
+    def __len__(self):
+        return len(self._shelf)
+
     def __contains__(self, key):
         return self._shelf.__contains__(key)
@@ -3,28 +3,54 @@ import os
 from argparse import Namespace
 from collections import namedtuple
 from copy import deepcopy
+from functools import lru_cache
 from os.path import exists
 from pathlib import Path
-from typing import Union, Iterable, Dict
+from typing import Union, Iterable, Dict, Tuple, Any
 
-import yaml
 
 from ddb.config.merger import config_merger
 from ddb.config.migrations import MigrationsDotty
+from ddb.utils.compat import yaml_safe_load
 
 ConfigPaths = namedtuple('ConfigPaths', ['ddb_home', 'home', 'project_home'])
 
+_yaml_cache = {}  # type: Dict[str, Tuple[Tuple[int, int], Any]]
+
+
+def _load_yaml_file(file: str):
+    # Cache only lives for a single run, as it's dropped by Config.clear_files_cache on reset and before watch mode
+    # reloads, since mtime resolution can't detect all changes. It avoids parsing files again when configuration
+    # is read many times in the same run. A single entry is kept for each file.
+    stat = os.stat(file)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _yaml_cache.get(file)
+    if cached is None or cached[0] != signature:
+        with open(file, 'rb') as stream:
+            cached = (signature, yaml_safe_load(stream))
+        _yaml_cache[file] = cached
+    return deepcopy(cached[1])
+
+
+@lru_cache(maxsize=None)
+def _configuration_candidates(filenames: Tuple[str, ...], extensions: Tuple[str, ...]):
+    """
+    Candidate configuration file names, as (basename, filename, basename_has_extension) tuples.
+    """
+    return tuple((basename, basename + '.' + ext, basename.endswith('.' + ext))
+                 for basename in filenames
+                 for ext in extensions)
+
 
 def configuration_file(path: str, filenames: Iterable[str], extensions: Iterable[str]):
     """
     Find configuration file for given path and possible filename/extensions
     """
     if path:
-        for basename in filenames:
-            for ext in extensions:
-                file = os.path.join(path, basename + '.' + ext)
-                if exists(file):
-                    return file
+        for _, filename, _ in _configuration_candidates(tuple(filenames), tuple(extensions)):
+            file = os.path.join(path, filename)
+            if exists(file):
+                return file
     return None
 
 
@@ -35,19 +61,24 @@ def get_default_config_paths(env_prefix, filenames, extensions) -> ConfigPaths:
     if os.environ.get(env_prefix + '_PROJECT_HOME'):
         project_home = os.environ.get(env_prefix + '_PROJECT_HOME')
     else:
-        project_home_candidate = os.getcwd()
+        cwd = os.getcwd()
+        project_home_candidate = cwd
         while not configuration_file(project_home_candidate, filenames, extensions):
-            project_home_candidate_parent = str(Path(project_home_candidate).parent)
+            project_home_candidate_parent = os.path.dirname(project_home_candidate)
             if project_home_candidate_parent == project_home_candidate:
-                project_home_candidate = os.getcwd()
+                project_home_candidate = cwd
                 break
             project_home_candidate = project_home_candidate_parent
         project_home = project_home_candidate
 
     project_home = os.path.abspath(project_home)
 
-    home = os.environ.get(env_prefix + '_HOME', os.path.join(str(Path.home()), '.docker-devbox'))
-    ddb_home = os.environ.get(env_prefix + '_DDB_HOME', os.path.join(home, 'ddb'))
+    home = os.environ.get(env_prefix + '_HOME')
+    if home is None:
+        home = os.path.join(str(Path.home()), '.docker-devbox')
+    ddb_home = os.environ.get(env_prefix + '_DDB_HOME')
+    if ddb_home is None:
+        ddb_home = os.path.join(home, 'ddb')
 
     return ConfigPaths(ddb_home=ddb_home, home=home, project_home=project_home)
 
@@ -86,6 +117,14 @@ class Config:  # pylint:disable=too-many-instance-attributes
         Reset the configuration object, while keeping configured paths.
         """
         self.__init__(*args, paths=self.paths, **kwargs)
+        self.clear_files_cache()
+
+    @staticmethod
+    def clear_files_cache():
+        """
+        Clear parsed configuration files cache.
+        """
+        _yaml_cache.clear()
 
     def clear(self):
         """
@@ -135,16 +174,16 @@ class Config:  # pylint:disable=too-many-instance-attributes
         Possible configuration files to load.
         """
         ret = []
+        candidates = _configuration_candidates(tuple(self.filenames), tuple(self.extensions))
         for path in self.paths:
             if not path:
                 continue
-            for basename in self.filenames:
-                for ext in self.extensions:
-                    if basename.endswith('.' + ext) and os.path.exists(os.path.join(path, basename)):
-                        file = os.path.join(path, basename)
-                    else:
-                        file = os.path.join(path, basename + '.' + ext)
-                    ret.append(file)
+            for basename, filename, basename_has_extension in candidates:
+                if basename_has_extension and os.path.exists(os.path.join(path, basename)):
+                    file = os.path.join(path, basename)
+                else:
+                    file = os.path.join(path, filename)
+                ret.append(file)
         return ret
 
     def read(self, defaults=None, files=None):
@@ -163,11 +202,10 @@ class Config:  # pylint:disable=too-many-instance-attributes
 
         for file in files:
             if exists(file):
-                with open(file, 'rb') as stream:
-                    file_data = yaml.safe_load(stream)
-                    found_files[file] = self.apply_environ_overrides(deepcopy(file_data))
-                    if file_data:
-                        loaded_data = config_merger.merge(loaded_data, file_data)
+                file_data = _load_yaml_file(file)
+                found_files[file] = self.apply_environ_overrides(deepcopy(file_data))
+                if file_data:
+                    loaded_data = config_merger.merge(loaded_data, file_data)
 
         if Config.overrides:  # pylint:disable=using-constant-test
             Config.overrides(loaded_data)
@@ -206,7 +244,14 @@ class Config:  # pylint:disable=too-many-instance-attributes
             prefix = self.env_override_prefix
         prefix = prefix.upper()
 
-        environ_value = os.environ.get(prefix)
+        environ_overrides = {key: value for (key, value) in os.environ.items() if value and key.startswith(prefix)}
+        if not environ_overrides:
+            return data
+
+        return self._apply_environ_overrides(data, prefix, environ_overrides)
+
+    def _apply_environ_overrides(self, data, prefix, environ_overrides):
+        environ_value = environ_overrides.get(prefix)
         if environ_value:
             if environ_value.lower() == str(True):
                 environ_value = True
@@ -218,21 +263,23 @@ class Config:  # pylint:disable=too-many-instance-attributes
                 environ_value = bool(environ_value)
             return environ_value
 
+        if not any(key.startswith(prefix) for key in environ_overrides):
+            return data
+
         if isinstance(data, dict):
             for (name, value) in data.items():
                 key_prefix = prefix + "_" + name
                 key_prefix = key_prefix.upper()
 
-                data[name] = self.apply_environ_overrides(value, key_prefix)
+                data[name] = self._apply_environ_overrides(value, key_prefix, environ_overrides)
         if isinstance(data, list):
             i = 0
             for value in data:
                 replace_prefix = prefix + "[" + str(i) + "]"
                 replace_prefix = replace_prefix.upper()
 
-                environ_value = os.environ.get(replace_prefix)
-                if environ_value:
-                    data[i] = self.apply_environ_overrides(value, replace_prefix)
+                if environ_overrides.get(replace_prefix):
+                    data[i] = self._apply_environ_overrides(value, replace_prefix, environ_overrides)
 
                 i += 1
 
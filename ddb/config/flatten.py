@@ -54,48 +54,43 @@ def flatten(data: Union[Dotty, dict], prefix=None, sep=".", array_index_format="
                     keep_primitive_list, stop_for, data=dict(data))
 
 
+def _identity(value):
+    return value
+
+
+def _is_primitive_list(data: list):
+    return not data or not set(filter(lambda x: x not in (int, float, bool, str), set(map(type, data))))
+
+
 def _flatten(prefix=None, sep=".", array_index_format="[%s]",
              key_transformer=None, value_transformer=None, keep_primitive_list=False,
              stop_for=(), data=None, output=None) -> dict:
     if output is None:
         output = {}
 
-    if prefix is None:
-        prefix = ""
     if key_transformer is None:
-        key_transformer = lambda x: x
+        key_transformer = _identity
     if value_transformer is None:
-        value_transformer = lambda x: x
-
-    stop_recursion = False
-    if prefix in stop_for:
-        stop_recursion = True
-
-    if not stop_recursion and isinstance(data, dict):
-        for (name, value) in data.items():
-            key_prefix = (prefix + sep if prefix else "") + key_transformer(name)
-            key_prefix = key_transformer(key_prefix)
-
-            _flatten(key_prefix, sep, array_index_format,
-                     key_transformer, value_transformer, keep_primitive_list,
-                     stop_for, value, output)
-
-    elif not stop_recursion and isinstance(data, list):
-        if keep_primitive_list and (not data or
-                                    not set(filter(lambda x: x not in (int, float, bool, str), set(map(type, data))))):
-            output[prefix] = value_transformer(data)
-        else:
-            i = 0
-            for value in data:
-                replace_prefix = (prefix if prefix else "") + (array_index_format % str(i))
-                replace_prefix = key_transformer(replace_prefix)
-
-                _flatten(replace_prefix, sep, array_index_format,
-                         key_transformer, value_transformer, keep_primitive_list,
-                         stop_for, value, output)
-
-                i += 1
-    else:
+        value_transformer = _identity
+
+    # Iterative depth-first walk, with children pushed in reverse order to keep the same output order as a recursive
+    # walk.
+    stack = [(prefix if prefix else "", data)]
+    while stack:
+        prefix, data = stack.pop()
+
+        if prefix not in stop_for:
+            if isinstance(data, dict):
+                parent_prefix = prefix + sep if prefix else ""
+                stack.extend(reversed([(key_transformer(parent_prefix + key_transformer(name)), value)
+                                       for (name, value) in data.items()]))
+                continue
+
+            if isinstance(data, list) and not (keep_primitive_list and _is_primitive_list(data)):
+                stack.extend(reversed([(key_transformer(prefix + array_index_format % str(i)), value)
+                                       for (i, value) in enumerate(data)]))
+                continue
+
         output[prefix] = value_transformer(data)
 
     return output
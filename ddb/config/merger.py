@@ -97,7 +97,66 @@ def merge_value_strategy_wrapper(strategy):
     return wrapped_strategy
 
 
-config_merger = Merger(
+def _has_merge_value_dicts(result):
+    stack = [result]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            for item in value.values():
+                if isinstance(item, dict):
+                    if 'merge' in item and 'value' in item:
+                        return True
+                elif isinstance(item, list):
+                    stack.append(item)
+        elif isinstance(value, list):
+            stack.extend(value)
+    return False
+
+
+def _can_merge_plain_dicts(base: dict, nxt: dict):
+    stack = [(base, nxt)]
+    while stack:
+        base_dict, nxt_dict = stack.pop()
+        if _has_merge_value_dicts(base_dict) or _has_merge_value_dicts(nxt_dict):
+            return False
+        if ('merge' in base_dict or 'merge' in nxt_dict) and ('value' in base_dict or 'value' in nxt_dict):
+            # merge/value dict may be built from keys of both dicts.
+            return False
+        for key, value in nxt_dict.items():
+            if key in base_dict and isinstance(value, dict) and isinstance(base_dict[key], dict):
+                stack.append((base_dict[key], value))
+    return True
+
+
+def _merge_plain_dicts(base: dict, nxt: dict):
+    stack = [(base, nxt)]
+    while stack:
+        base_dict, nxt_dict = stack.pop()
+        for key, value in nxt_dict.items():
+            if key in base_dict:
+                base_value = base_dict[key]
+                if isinstance(value, dict) and isinstance(base_value, dict):
+                    stack.append((base_value, value))
+                    continue
+            base_dict[key] = value
+    return base
+
+
+class ConfigMerger(Merger):
+    """
+    Configuration merger, with a fast path for dicts that don't contain merge/value dicts.
+
+    In this case, strategies are known to merge dicts recursively and override any other value, so they are
+    processed by a plain loop instead of deepmerge strategies.
+    """
+
+    def merge(self, base, nxt):
+        if isinstance(base, dict) and isinstance(nxt, dict) and _can_merge_plain_dicts(base, nxt):
+            return _merge_plain_dicts(base, nxt)
+        return super().merge(base, nxt)
+
+
+config_merger = ConfigMerger(
     [
         (list, merge_value_strategy_wrapper(ListStrategies.strategy_override)),
         (dict, merge_value_strategy_wrapper(DictStrategies.strategy_merge))
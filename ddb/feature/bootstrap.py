@@ -1,54 +1,92 @@
 # -*- coding: utf-8 -*-
-from typing import Iterable
-
-import pkg_resources
-from toposort import toposort_flatten
+from collections import defaultdict
+from importlib import import_module
+from typing import Iterable, List, Dict, Set
 
 from . import features
-from .certs import CertsFeature
-from .cookiecutter import CookiecutterFeature
-from .copy import CopyFeature
-from .core import CoreFeature
-from .docker import DockerFeature
 from .feature import Feature
-from .file import FileFeature
-from .fixuid import FixuidFeature
-from .git import GitFeature
-from .gitignore import GitignoreFeature
-from .jinja import JinjaFeature
-from .jsonnet import JsonnetFeature
-from .permissions import PermissionsFeature
-from .run import RunFeature
-from .shell import ShellFeature
-from .smartcd import SmartcdFeature
-from .symlinks import SymlinksFeature
-from .traefik import TraefikFeature
-from .version import VersionFeature
-from .ytt import YttFeature
 from ..config import config
 from ..config import migrations
 
-_default_available_features = [CertsFeature(),
-                               CopyFeature(),
-                               CookiecutterFeature(),
-                               CoreFeature(),
-                               DockerFeature(),
-                               FileFeature(),
-                               FixuidFeature(),
-                               GitFeature(),
-                               GitignoreFeature(),
-                               JinjaFeature(),
-                               JsonnetFeature(),
-                               PermissionsFeature(),
-                               RunFeature(),
-                               SmartcdFeature(),
-                               ShellFeature(),
-                               SymlinksFeature(),
-                               TraefikFeature(),
-                               VersionFeature(),
-                               YttFeature()]
-
-_available_features = list(_default_available_features)
+# Default features are declared as (module, class) pairs and imported on first use only, so that importing this
+# module doesn't pull every feature backend (jinja, jsonnet, netifaces, cookiecutter, ...).
+_default_feature_classes = (('certs', 'CertsFeature'),
+                            ('copy', 'CopyFeature'),
+                            ('cookiecutter', 'CookiecutterFeature'),
+                            ('core', 'CoreFeature'),
+                            ('docker', 'DockerFeature'),
+                            ('file', 'FileFeature'),
+                            ('fixuid', 'FixuidFeature'),
+                            ('git', 'GitFeature'),
+                            ('gitignore', 'GitignoreFeature'),
+                            ('jinja', 'JinjaFeature'),
+                            ('jsonnet', 'JsonnetFeature'),
+                            ('permissions', 'PermissionsFeature'),
+                            ('run', 'RunFeature'),
+                            ('smartcd', 'SmartcdFeature'),
+                            ('shell', 'ShellFeature'),
+                            ('symlinks', 'SymlinksFeature'),
+                            ('traefik', 'TraefikFeature'),
+                            ('version', 'VersionFeature'),
+                            ('ytt', 'YttFeature'))
+
+_default_available_features = None  # type: List[Feature]
+
+_available_features = None  # type: List[Feature]
+
+_entrypoint_features = None  # type: List[Feature]
+
+_optional_dependency_suffix = '[optional]'
+_optional_dependency_suffix_length = len(_optional_dependency_suffix)
+
+
+def _iter_entry_points(group: str):
+    """
+    Iterate setuptools entrypoints of given group, using importlib.metadata when available as it's much faster to
+    import than pkg_resources.
+    """
+    try:
+        from importlib.metadata import entry_points  # pylint:disable=import-outside-toplevel
+    except ImportError:  # Python < 3.8
+        import pkg_resources  # pylint:disable=import-outside-toplevel
+        return pkg_resources.iter_entry_points(group)
+
+    all_entry_points = entry_points()
+    if hasattr(all_entry_points, 'select'):
+        return all_entry_points.select(group=group)
+    return all_entry_points.get(group, [])
+
+
+def get_entrypoint_features() -> List[Feature]:
+    """
+    Load features from setuptools entrypoint 'ddb_features'. Result is cached, so installed distributions are
+    scanned only once per process.
+    """
+    global _entrypoint_features  # pylint:disable=global-statement
+    if _entrypoint_features is None:
+        _entrypoint_features = [entry_point.load()() for entry_point in _iter_entry_points('ddb_features')]
+    return _entrypoint_features
+
+
+def get_default_available_features() -> List[Feature]:
+    """
+    Get default features, importing and instantiating them on first call.
+    """
+    global _default_available_features  # pylint:disable=global-statement
+    if _default_available_features is None:
+        _default_available_features = [getattr(import_module('.' + module_name, __package__), class_name)()
+                                       for module_name, class_name in _default_feature_classes]
+    return _default_available_features
+
+
+def get_available_features() -> List[Feature]:
+    """
+    Get available features, default ones and appended ones.
+    """
+    global _available_features  # pylint:disable=global-statement
+    if _available_features is None:
+        _available_features = list(get_default_available_features())
+    return _available_features
 
 
 def get_sorted_features(available_features: Iterable[Feature] = None):
@@ -58,15 +96,14 @@ def get_sorted_features(available_features: Iterable[Feature] = None):
     Withing a command phase, actions are executed in the order of their feature registration.
     """
     if available_features is None:
-        available_features = _available_features
+        available_features = get_available_features()
 
     entrypoint_features = {f.name: f for f in available_features}
-    for entry_point in pkg_resources.iter_entry_points('ddb_features'):
-        feature = entry_point.load()()
+    for feature in get_entrypoint_features():
         entrypoint_features[feature.name] = feature
 
     required_dependencies, toposort_data = _prepare_dependencies_data(entrypoint_features)
-    _check_missing_dependencies(entrypoint_features, required_dependencies)
+    _check_missing_dependencies(set(entrypoint_features), required_dependencies)
 
     dependencies = config.data.get('dependencies')
     if dependencies:
@@ -76,13 +113,49 @@ def get_sorted_features(available_features: Iterable[Feature] = None):
             for feat_dependency in feat_dependencies:
                 toposort_data[feat].add(feat_dependency)
 
-    sorted_feature_names = toposort_flatten(toposort_data, sort=True)
+    sorted_feature_names = _toposort_flatten(toposort_data)
     for feature_name in sorted_feature_names:
         feature = entrypoint_features.get(feature_name)
         if feature:
             yield feature
 
 
+def _toposort_flatten(toposort_data: Dict[str, Set[str]]) -> List[str]:
+    """
+    Sort items topologically using Kahn's algorithm, level by level. Items of a same level are sorted by name so the
+    result is deterministic.
+    """
+    dependencies = {item: set(item_dependencies) - {item} for item, item_dependencies in toposort_data.items()}
+    for item_dependencies in list(dependencies.values()):
+        for dependency in item_dependencies:
+            dependencies.setdefault(dependency, set())
+
+    dependents = defaultdict(list)
+    remaining = {}
+    for item, item_dependencies in dependencies.items():
+        remaining[item] = len(item_dependencies)
+        for dependency in item_dependencies:
+            dependents[dependency].append(item)
+
+    sorted_items = []
+    level = sorted(item for item, count in remaining.items() if not count)
+    while level:
+        sorted_items.extend(level)
+        next_level = []
+        for item in level:
+            for dependent in dependents[item]:
+                remaining[dependent] -= 1
+                if not remaining[dependent]:
+                    next_level.append(dependent)
+        level = sorted(next_level)
+
+    if len(sorted_items) != len(remaining):
+        circular = sorted(item for item, count in remaining.items() if count)
+        raise ValueError("Circular dependencies exist among these features: " + ", ".join(circular))
+
+    return sorted_items
+
+
 def _prepare_dependencies_data(entrypoint_features):
     """
     Compute required dependencies and toposort data.
@@ -93,10 +166,10 @@ def _prepare_dependencies_data(entrypoint_features):
         feat_required_dependencies = []
         dependencies = set()
         for dependency_item in feat.dependencies:
-            if not dependency_item.endswith('[optional]'):
+            if not dependency_item.endswith(_optional_dependency_suffix):
                 feat_required_dependencies.append(dependency_item)
             else:
-                dependency_item = dependency_item[0:len(dependency_item) - len('[optional]')]
+                dependency_item = dependency_item[:-_optional_dependency_suffix_length]
             dependencies.add(dependency_item)
 
         toposort_data[name] = dependencies
@@ -104,13 +177,13 @@ def _prepare_dependencies_data(entrypoint_features):
     return required_dependencies, toposort_data
 
 
-def _check_missing_dependencies(entrypoint_features, required_dependencies):
+def _check_missing_dependencies(feature_names: Set[str], required_dependencies):
     """
     Check missing required dependencies
     """
     for name, feat_required_dependencies in required_dependencies.items():
         for required_dependency in feat_required_dependencies:
-            if required_dependency not in entrypoint_features.keys():
+            if required_dependency not in feature_names:
                 raise ValueError("A required dependency is missing for " +
                                  name + " feature (" + required_dependency + ")")
 
@@ -120,15 +193,14 @@ def reset_available_features():
     Reset available features to default list.
     """
     global _available_features  # pylint:disable=global-statement
-    _available_features = list(_default_available_features)
+    _available_features = None
 
 
 def append_available_feature(feature):
     """
     Append a feature to available features list.
     """
-    global _available_features  # pylint:disable=global-statement,global-variable-not-assigned
-    _available_features.append(feature)
+    get_available_features().append(feature)
 
 
 def bootstrap_register_features():
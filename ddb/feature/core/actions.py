@@ -10,7 +10,6 @@ from typing import Optional
 from urllib.error import HTTPError
 
 import requests
-import yaml
 from dotty_dict import Dotty
 from progress.bar import IncrementalBar
 from semver import VersionInfo
@@ -22,6 +21,7 @@ from ddb.config import config
 from ddb.event import events
 from ddb.utils.file import force_remove
 from ddb.utils.table_display import get_table_display
+from ddb.utils.compat import yaml_safe_dump
 from .. import features
 from ...action.action import EventBinding
 from ...action.runner import FailFastError, ExpectedError
@@ -275,8 +275,8 @@ class FeaturesAction(Action):
         """
         enabled_features = [f for f in features.all() if not f.disabled]
 
-        for feature in enabled_features:
-            print("%s: %s" % (feature.name, feature.description))
+        if enabled_features:
+            print("\n".join("%s: %s" % (feature.name, feature.description) for feature in enabled_features))
 
 
 class ConfigAction(Action):
@@ -345,12 +345,11 @@ class ConfigAction(Action):
     @staticmethod
     def _print_config_yaml(configuration, configuration_files):
         if config.args.files and configuration_files:
-            for file, configuration_file in configuration_files.items():
-                print(f"--- # {file}")
-                print(yaml.safe_dump(configuration_file))
+            print(''.join(f"--- # {file}\n{yaml_safe_dump(configuration_file)}\n"
+                          for file, configuration_file in configuration_files.items()), end='')
         else:
             if isinstance(configuration, (dict, list)):
-                print(yaml.safe_dump(configuration))
+                print(yaml_safe_dump(configuration))
             elif configuration is not None:
                 print(configuration)
 
@@ -499,6 +498,7 @@ class ReloadConfigAction(Action):
         Execute action
         """
         if context.watching:
+            config.clear_files_cache()
             data, _ = config.read()
             try:
                 context.log.info("Configuration file has changed.")
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import os
 import re
+from functools import lru_cache
 from typing import Iterable, ClassVar
 
 import netifaces
@@ -15,6 +16,16 @@ from ...action import Action
 from ...config import config
 from ...utils.compat import path_as_posix_fast
 
+_docker_host_ip_regex = re.compile(r"(?:.*?)://(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}).*")
+
+
+@lru_cache(maxsize=8)
+def _interface_ipv4_address(interface: str):
+    docker_if = netifaces.ifaddresses(interface)
+    if docker_if and netifaces.AF_INET in docker_if:
+        return docker_if[netifaces.AF_INET][0].get('addr')
+    return None
+
 
 class DockerFeature(Feature):
     """
@@ -44,8 +55,15 @@ class DockerFeature(Feature):
 
     def _configure_defaults(self, feature_config: Dotty):
         self._configure_defaults_ip(feature_config)
-        self._configure_defaults_user_from_name_and_group(feature_config)
-        self._configure_defaults_user(feature_config)
+
+        # User configuration is handled as a plain dict to avoid dotty key parsing on each access.
+        user_config = feature_config.get('user')
+        if user_config is None:
+            user_config = {}
+            feature_config['user'] = user_config
+        self._configure_defaults_user_from_name_and_group(user_config)
+        self._configure_defaults_user(user_config)
+
         self._configure_defaults_path_mapping(feature_config)
 
     def _configure_defaults_ip(self, feature_config):
@@ -53,81 +71,72 @@ class DockerFeature(Feature):
         if not ip_address:
             docker_host = os.environ.get('DOCKER_HOST')
             if docker_host:
-                ip_match = re.match(r"(?:.*?)://(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}).*", docker_host)
+                ip_match = _docker_host_ip_regex.match(docker_host)
                 if ip_match:
                     ip_address = ip_match.group(1)
 
-        try:
-            if not ip_address:
-                interface = feature_config.get('interface')
-                try:
-                    docker_if = netifaces.ifaddresses(interface)
-                except ValueError as err:
-                    raise FeatureConfigurationAutoConfigureError(self, 'ip',
-                                                                 "Invalid network interface: " + interface) from err
-                if docker_if and netifaces.AF_INET in docker_if:
-                    docker_af_inet = docker_if[netifaces.AF_INET][0]
-                    ip_address = docker_af_inet['addr']
-                else:
-                    raise FeatureConfigurationAutoConfigureError(self, 'ip',
-                                                                 "Can't get ip address "
-                                                                 "from network interface configuration: " + interface)
-        except FeatureConfigurationAutoConfigureError:
+        if not ip_address:
+            try:
+                ip_address = _interface_ipv4_address(feature_config.get('interface'))
+            except ValueError:  # Invalid network interface
+                ip_address = None
+
+        if not ip_address:
             ip_address = '127.0.0.1'
 
         feature_config['ip'] = ip_address
 
     @staticmethod
-    def _configure_defaults_user_from_name_and_group(feature_config):
-        uid = feature_config.get('user.uid')
-        gid = feature_config.get('user.gid')
+    def _configure_defaults_user_from_name_and_group(user_config: dict):
+        uid = user_config.get('uid')
+        gid = user_config.get('gid')
 
         if uid is None or gid is None:
-            name = feature_config.get('user.name')
+            name = user_config.get('name')
             if name:
                 try:
                     import pwd  # pylint:disable=import-outside-toplevel
                     struct_passwd = pwd.getpwnam(name)
                     if uid is None:
                         uid = struct_passwd.pw_uid
-                        feature_config['user.uid'] = uid
+                        user_config['uid'] = uid
                     if gid is None:
                         gid = struct_passwd.pw_gid
-                        feature_config['user.gid'] = gid
+                        user_config['gid'] = gid
                 except ImportError:
                     pass
                 except KeyError:
                     pass
 
-            group = feature_config.get('user.group')
+            group = user_config.get('group')
             if group:
                 try:
                     import grp  # pylint:disable=import-outside-toplevel
                     struct_group = grp.getgrnam(group)
                     gid = struct_group.gr_id
-                    feature_config['user.gid'] = gid
+                    user_config['gid'] = gid
                 except ImportError:
                     pass
                 except KeyError:
                     pass
 
     @staticmethod
-    def _configure_defaults_user(feature_config):
-        uid = feature_config.get('user.uid')
+    def _configure_defaults_user(user_config: dict):
+        uid = user_config.get('uid')
         if uid is None:
             try:
                 uid = os.getuid()  # pylint:disable=no-member
             except AttributeError:
                 uid = 1000
-            feature_config['user.uid'] = uid
+            user_config['uid'] = uid
 
-        gid = feature_config.get('user.gid')
+        gid = user_config.get('gid')
         if gid is None:
             try:
                 gid = os.getgid()  # pylint:disable=no-member
             except AttributeError:
                 gid = 1000
-            feature_config['user.gid'] = gid
+            user_config['gid'] = gid
 
     @staticmethod
     def _configure_defaults_path_mapping(feature_config):
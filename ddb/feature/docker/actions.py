@@ -5,12 +5,12 @@ import re
 from pathlib import PurePosixPath, Path
 from typing import Union, Iterable, List, Dict, Set
 
-import yaml
 from dotty_dict import Dotty
 
 from ddb.feature import features
 from ddb.feature.traefik import TraefikExtraServicesAction
 from ddb.utils.simpleeval import simple_eval
+from ddb.utils.compat import yaml_safe_load
 from .binaries import DockerBinary
 from .lib.compose.config.types import ServicePort
 from .utils import DockerComposeControl
@@ -67,7 +67,7 @@ class EmitDockerComposeConfigAction(Action):
             return
         self.current_yaml_output = yaml_output
 
-        docker_compose_config = Dotty(yaml.load(yaml_output, yaml.SafeLoader))
+        docker_compose_config = Dotty(yaml_safe_load(yaml_output))
         events.docker.docker_compose_config(docker_compose_config=docker_compose_config)
 
         services = docker_compose_config.get('services')
@@ -439,7 +439,7 @@ class DockerDisplayInfoAction(Action):
             return
         self.current_yaml_output = yaml_output
 
-        docker_compose_config = Dotty(yaml.load(yaml_output, yaml.SafeLoader))
+        docker_compose_config = Dotty(yaml_safe_load(yaml_output))
         services = docker_compose_config.get('services')
         if not services:
             return
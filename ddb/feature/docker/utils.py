@@ -2,11 +2,11 @@ import os
 import shlex
 from subprocess import CalledProcessError
 
-import yaml
 
 from ddb.config import config
 from ddb.feature.docker.lib.compose.config.errors import ConfigurationError
 from ddb.utils.process import run
+from ddb.utils.compat import yaml_safe_load
 
 
 def get_mapped_path(path: str):
@@ -126,7 +126,7 @@ class DockerComposeControl:
 
         compose_config = run(*self.docker_compose_command, "config")
         if parse:
-            return yaml.load(compose_config, yaml.SafeLoader)
+            return yaml_safe_load(compose_config)
         return compose_config
 
 
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from abc import ABC
+from functools import lru_cache
 from os import linesep
 from typing import ClassVar, Iterable, Union
 
@@ -16,6 +17,11 @@ from ..registry import RegistryObject
 from ..service import Service
 
 
+@lru_cache(maxsize=None)
+def _get_schema_instance(schema_class):
+    return schema_class()
+
+
 class Feature(RegistryObject, ABC):  # pylint:disable=abstract-method
     """
     A feature provides phases, commands, binaries, actions and services. It can be configured with a key matching it's
@@ -87,7 +93,7 @@ class Feature(RegistryObject, ABC):  # pylint:disable=abstract-method
         """
         Sanitize and validate using given schema part of the configuration.
         """
-        schema = self.schema()
+        schema = _get_schema_instance(self.schema)
         raw_feature_config = feature_config
 
         if not raw_feature_config:
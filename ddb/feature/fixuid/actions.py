@@ -4,12 +4,14 @@ import os
 import re
 import shlex
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from io import BytesIO
+from stat import S_IWUSR
 from subprocess import CalledProcessError
-from typing import Iterable
+from typing import Iterable, Dict, Optional
 
-from chmod_monkey import tmp_chmod
 from dockerfile_parse import DockerfileParser
-from dotty_dict import Dotty
 
 from ..copy.actions import copy_from_url
 from ...action import Action
@@ -22,18 +24,73 @@ from ...utils.process import run
 
 BuildServiceDef = namedtuple("BuildServiceDef", "context dockerfile")
 
+_entrypoint_quotes_regex = re.compile(r"^(['\"]?)(.*?)(['\"]?)$")
+_shlex_escape_regex = re.compile(r"['\"\\]")
+
+
+def _is_non_root_user_or_other(instruction):
+    if instruction['instruction'] != 'USER':
+        return True
+    value = instruction.get('value')
+    return value and value.lower() != 'root'
+
+
+@contextmanager
+def _writable(filepath):
+    mode = os.stat(filepath).st_mode
+    if mode & S_IWUSR:
+        yield
+        return
+    os.chmod(filepath, mode | S_IWUSR)
+    try:
+        yield
+    finally:
+        os.chmod(filepath, mode)
+
 
 class CustomDockerfileParser(DockerfileParser):
     """
     Custom class to implement entrypoint property with the same behavior as cmd property.
     """
 
-    def get_last_instruction(self, instruction_type, instruction_condition=lambda instruction: True):
+    def __init__(self, *args, **kwargs):
+        self._last_instructions = None
+        super().__init__(*args, **kwargs)
+
+    @DockerfileParser.lines.setter
+    def lines(self, lines):
+        self._last_instructions = None
+        DockerfileParser.lines.fset(self, lines)
+
+    @DockerfileParser.content.setter
+    def content(self, content):
+        self._last_instructions = None
+        DockerfileParser.content.fset(self, content)
+
+    def _get_last_instructions(self):
+        """
+        Last instruction of each type in the final build stage, computed in a single pass over structure and
+        cached until Dockerfile is modified through this parser.
+        """
+        if self._last_instructions is None:
+            last_instructions = {}
+            for insndesc in self.structure:
+                if insndesc['instruction'] == 'FROM':  # new stage, reset
+                    last_instructions = {}
+                else:
+                    last_instructions[insndesc['instruction']] = insndesc
+            self._last_instructions = last_instructions
+        return self._last_instructions
+
+    def get_last_instruction(self, instruction_type, instruction_condition=None):
         """
         Determine the final instruction_type instruction, if any, in the final build stage.
         instruction_types from earlier stages are ignored.
         :return: value of final stage instruction_type instruction
         """
+        if instruction_condition is None:
+            return self._get_last_instructions().get(instruction_type)
+
         last_instruction = None
         for insndesc in self.structure:
             if insndesc['instruction'] == 'FROM':  # new stage, reset
@@ -42,6 +99,26 @@ class CustomDockerfileParser(DockerfileParser):
                 last_instruction = insndesc
         return last_instruction
 
+    def get_last_instructions(self, instruction_types, instruction_condition=None):
+        """
+        Determine the final instruction of each given instruction_types, if any, in the final build stage, with a
+        single pass over structure.
+        instruction_types from earlier stages are ignored.
+        :return: dict of final stage instructions, by instruction type
+        """
+        if instruction_condition is None:
+            last_instructions = self._get_last_instructions()
+            return {instruction_type: last_instructions[instruction_type]
+                    for instruction_type in instruction_types if instruction_type in last_instructions}
+
+        last_instructions = {}
+        for insndesc in self.structure:
+            if insndesc['instruction'] == 'FROM':  # new stage, reset
+                last_instructions = {}
+            elif insndesc['instruction'] in instruction_types and instruction_condition(insndesc):
+                last_instructions[insndesc['instruction']] = insndesc
+        return last_instructions
+
     @property
     def entrypoint(self):
         """
@@ -57,12 +134,7 @@ class CustomDockerfileParser(DockerfileParser):
         """
         setter for final 'ENTRYPOINT' instruction in final build stage
         """
-        entrypoint = None
-        for insndesc in self.structure:
-            if insndesc['instruction'] == 'FROM':  # new stage, reset
-                entrypoint = None
-            elif insndesc['instruction'] == 'ENTRYPOINT':
-                entrypoint = insndesc
+        entrypoint = self.get_last_instruction("ENTRYPOINT")
 
         if value:
             new_entrypoint = 'ENTRYPOINT ' + value
@@ -86,13 +158,8 @@ class CustomDockerfileParser(DockerfileParser):
         CMDs from earlier stages are ignored.
         :return: value of final stage CMD instruction
         """
-        value = None
-        for insndesc in self.structure:
-            if insndesc['instruction'] == 'FROM':  # new stage, reset
-                value = None
-            elif insndesc['instruction'] == 'CMD':
-                value = insndesc['value']
-        return value
+        last_instruction = self.get_last_instruction("CMD")
+        return last_instruction['value'] if last_instruction else None
 
     @cmd.setter
     def cmd(self, value):
@@ -100,12 +167,7 @@ class CustomDockerfileParser(DockerfileParser):
         setter for final 'CMD' instruction in final build stage
 
         """
-        cmd = None
-        for insndesc in self.structure:
-            if insndesc['instruction'] == 'FROM':  # new stage, reset
-                cmd = None
-            elif insndesc['instruction'] == 'CMD':
-                cmd = insndesc
+        cmd = self.get_last_instruction("CMD")
 
         if value:
             new_cmd = 'CMD ' + value
@@ -130,6 +192,11 @@ class FixuidDockerComposeAction(Action):
 
     def __init__(self):
         self.docker_compose_config = {}
+        self._build_services = []
+        self._build_services_by_dockerfile = {}
+        self._fixuid_configuration_paths = {}
+        self._build_services_source = None
+        self._image_configs = None  # type: Optional[Dict[str, Optional[dict]]]
         self._dockerfile_lines = ("ADD fixuid.tar.gz /usr/local/bin",
                                   "RUN chown root:root /usr/local/bin/fixuid && "
                                   "chmod 4755 /usr/local/bin/fixuid && "
@@ -139,6 +206,9 @@ class FixuidDockerComposeAction(Action):
     @property
     def event_bindings(self):
         def file_generated_processor(source: str, target: str):
+            if os.path.basename(target) == 'fixuid.tar.gz':
+                # emitted by apply_fixuid itself, and never a Dockerfile.
+                return None
             service = self.find_fixuid_service(target)
             if service:
                 return (), {"service": service}
@@ -194,27 +264,50 @@ class FixuidDockerComposeAction(Action):
         context.log.debug("%s (%s)", image, inspect_data['Id'])
         return inspect_data
 
-    @staticmethod
-    def _get_image_config(image):
+    def _get_image_config(self, image):
         if image and image != 'scratch':
+            # Image configurations are kept during a single execution only, as images may be rebuilt or pulled
+            # again between executions.
+            if self._image_configs is not None and image in self._image_configs:
+                return self._image_configs[image]
             attrs = FixuidDockerComposeAction._get_inspect_data(image)
-            if attrs and 'Config' in attrs:
-                return attrs['Config']
+            image_config = attrs['Config'] if attrs and 'Config' in attrs else None
+            if self._image_configs is not None:
+                self._image_configs[image] = image_config
+            return image_config
         return None
 
     def apply_fixuid(self, service: BuildServiceDef):
         """
         Apply fixuid to given service
         """
-        dockerfile_path = os.path.join(service.context, service.dockerfile)
-        if os.path.exists(dockerfile_path):
-            with tmp_chmod(dockerfile_path, '+w'):
-                with open(dockerfile_path, "ba+") as dockerfile_file:
-                    parser = CustomDockerfileParser(fileobj=dockerfile_file)
+        dockerfile = self._load_dockerfile(service)
+        if dockerfile:
+            self._apply_fixuid_to_dockerfile(service, *dockerfile)
 
-                    if FixuidDockerComposeAction._apply_fixuid_from_parser(self, parser, service):
-                        context.log.success("Fixuid applied to %s",
-                                            os.path.relpath(dockerfile_path, config.paths.project_home))
+    @staticmethod
+    def _load_dockerfile(service: BuildServiceDef):
+        dockerfile_path = os.path.join(service.context, service.dockerfile)
+        if not os.path.exists(dockerfile_path):
+            return None
+        with open(dockerfile_path, "rb") as dockerfile_file:
+            dockerfile_content = dockerfile_file.read()
+
+        # Dockerfile is edited in memory, and written back only when it has been modified.
+        dockerfile_buffer = BytesIO(dockerfile_content)
+        parser = CustomDockerfileParser(fileobj=dockerfile_buffer)
+        return dockerfile_path, dockerfile_content, dockerfile_buffer, parser
+
+    def _apply_fixuid_to_dockerfile(self, service: BuildServiceDef, dockerfile_path: str, dockerfile_content: bytes,
+                                    dockerfile_buffer: BytesIO, parser: CustomDockerfileParser):
+        if FixuidDockerComposeAction._apply_fixuid_from_parser(self, parser, service):
+            new_dockerfile_content = dockerfile_buffer.getvalue()
+            if new_dockerfile_content != dockerfile_content:
+                with _writable(dockerfile_path):
+                    with open(dockerfile_path, "wb") as dockerfile_file:
+                        dockerfile_file.write(new_dockerfile_content)
+            context.log.success("Fixuid applied to %s",
+                                os.path.relpath(dockerfile_path, config.paths.project_home))
 
     def remove_fixuid(self, service: BuildServiceDef):
         """
@@ -222,7 +315,7 @@ class FixuidDockerComposeAction(Action):
         """
         dockerfile_path = os.path.join(service.context, service.dockerfile)
         if os.path.exists(dockerfile_path):
-            with tmp_chmod(dockerfile_path, '+w'):
+            with _writable(dockerfile_path):
                 with open(dockerfile_path, "ba+") as dockerfile_file:
                     parser = CustomDockerfileParser(fileobj=dockerfile_file)
 
@@ -230,8 +323,7 @@ class FixuidDockerComposeAction(Action):
                         context.log.success("Fixuid removed from %s",
                                             os.path.relpath(dockerfile_path, config.paths.project_home))
 
-    @staticmethod
-    def _get_cmd_and_entrypoint(parser):
+    def _get_cmd_and_entrypoint(self, parser):
         entrypoint = parser.entrypoint
         cmd = parser.cmd
         # if entrypoint is defined in Dockerfile, we should not grab cmd from base image
@@ -240,13 +332,11 @@ class FixuidDockerComposeAction(Action):
         reset_cmd = False
         if entrypoint and not cmd:
             reset_cmd = True
-        if not entrypoint:
-            baseimage_config = FixuidDockerComposeAction._get_image_config(parser.baseimage)
-            if baseimage_config and 'Entrypoint' in baseimage_config:
-                entrypoint = json.dumps(baseimage_config['Entrypoint'])
-        if not cmd and not reset_cmd:
-            baseimage_config = FixuidDockerComposeAction._get_image_config(parser.baseimage)
-            if baseimage_config and 'Cmd' in baseimage_config:
+        if not entrypoint or (not cmd and not reset_cmd):
+            baseimage_config = self._get_image_config(parser.baseimage)
+            if not entrypoint and baseimage_config and 'Entrypoint' in baseimage_config:
+                entrypoint = baseimage_config['Entrypoint']
+            if not cmd and not reset_cmd and baseimage_config and 'Cmd' in baseimage_config:
                 cmd = json.dumps(baseimage_config['Cmd'])
         if not cmd:
             cmd = None
@@ -287,6 +377,11 @@ class FixuidDockerComposeAction(Action):
                     return True
         return False
 
+    @staticmethod
+    def _has_fixuid_install(parser: CustomDockerfileParser):
+        return any(insndesc['instruction'] == 'ADD' and insndesc['value'].startswith('fixuid.tar.gz')
+                   for insndesc in parser.structure)
+
     def _apply_fixuid_from_parser(self, parser: CustomDockerfileParser, service: BuildServiceDef):
         if self._has_fixuid_disabled_comment(parser.lines):
             return False
@@ -304,7 +399,7 @@ class FixuidDockerComposeAction(Action):
         ret = False
         if not manual:
             if not manual_entrypoint:
-                cmd, entrypoint = FixuidDockerComposeAction._get_cmd_and_entrypoint(parser)
+                cmd, entrypoint = self._get_cmd_and_entrypoint(parser)
                 fixuid_entrypoint = FixuidDockerComposeAction._add_fixuid_entrypoint(entrypoint)
                 if fixuid_entrypoint:
                     parser.entrypoint = fixuid_entrypoint
@@ -312,12 +407,10 @@ class FixuidDockerComposeAction(Action):
                     parser.cmd = cmd
                 ret = True
 
-            if not manual_install and self._dockerfile_lines[0] + "\n" not in parser.lines:
-                last_instruction_user = parser \
-                    .get_last_instruction("USER",
-                                          lambda instruction: instruction.get('value') and
-                                                              instruction.get('value').lower() != 'root')
-                last_instruction_entrypoint = parser.get_last_instruction("ENTRYPOINT")
+            if not manual_install and not self._has_fixuid_install(parser):
+                last_instructions = parser.get_last_instructions(("USER", "ENTRYPOINT"), _is_non_root_user_or_other)
+                last_instruction_user = last_instructions.get("USER")
+                last_instruction_entrypoint = last_instructions.get("ENTRYPOINT")
                 if last_instruction_user:
                     parser.add_lines_at(last_instruction_user, *self._dockerfile_lines)
                 elif last_instruction_entrypoint:
@@ -329,7 +422,7 @@ class FixuidDockerComposeAction(Action):
         return ret
 
     def _remove_fixuid_from_parser(self, parser: CustomDockerfileParser, service: BuildServiceDef):
-        baseimage_config = FixuidDockerComposeAction._get_image_config(parser.baseimage)
+        baseimage_config = self._get_image_config(parser.baseimage)
         image_entrypoint = None
         if baseimage_config and 'Entrypoint' in baseimage_config:
             image_entrypoint = json.dumps(baseimage_config['Entrypoint'])
@@ -371,42 +464,94 @@ class FixuidDockerComposeAction(Action):
         """
         self.docker_compose_config = docker_compose_config
 
-        for service in self.get_fixuid_services():
-            self.apply_fixuid(service)
+        self._image_configs = {}
+        try:
+            dockerfiles = []
+            for service in self.get_fixuid_services():
+                dockerfile = self._load_dockerfile(service)
+                if dockerfile:
+                    dockerfiles.append((service, dockerfile))
+            self._prefetch_image_configs(parser for _, (_, _, _, parser) in dockerfiles)
+            for service, dockerfile in dockerfiles:
+                self._apply_fixuid_to_dockerfile(service, *dockerfile)
+        finally:
+            self._image_configs = None
+
+    def _prefetch_image_configs(self, parsers: Iterable[CustomDockerfileParser]):
+        """
+        Load base image configurations required by Dockerfiles concurrently, as it may require to pull images.
+        """
+        images = set()
+        for parser in parsers:
+            lines = parser.lines
+            if self._has_fixuid_disabled_comment(lines) or \
+                    self._has_fixuid_manual_comment(lines) or \
+                    self._has_fixuid_manual_entrypoint_comment(lines) or \
+                    parser.entrypoint:
+                # base image configuration is only required when ENTRYPOINT is missing.
+                continue
+            image = parser.baseimage
+            if image and image != 'scratch' and image not in self._image_configs:
+                images.add(image)
+
+        if len(images) < 2:
+            # A single image is loaded when applying fixuid to the service.
+            return
+
+        # Errors are ignored here, as they will be raised again when applying fixuid to the service.
+        with ThreadPoolExecutor(max_workers=min(8, len(images))) as executor:
+            wait([executor.submit(self._get_image_config, image) for image in images])
 
     def find_fixuid_service(self, dockerfile_filepath: str, include_missing_fixuid=False):
         """
         Find related fixuid service from dockerfile filepath
         """
-        for service in self.get_fixuid_services(include_missing_fixuid):
-            if os.path.abspath(os.path.join(service.context, service.dockerfile)) == \
-                    os.path.abspath(dockerfile_filepath):
+        self._get_build_services()
+        for service in self._build_services_by_dockerfile.get(os.path.abspath(dockerfile_filepath), ()):
+            if include_missing_fixuid or self._has_fixuid_configuration(service):
                 return service
         return None
 
+    def _get_build_services(self) -> Iterable[BuildServiceDef]:
+        """
+        Services with a build configuration, computed and indexed by dockerfile path once for each docker compose
+        configuration.
+        """
+        if self._build_services_source is not self.docker_compose_config:
+            build_services = []
+            for service in (self.docker_compose_config.get("services") or {}).values():
+                build = service.get("build")
+                if isinstance(build, dict):
+                    build_context = build.get("context")
+                    dockerfile = build.get("dockerfile", "Dockerfile")
+                elif isinstance(build, str):
+                    build_context = build
+                    dockerfile = "Dockerfile"
+                else:
+                    continue
+                build_services.append(BuildServiceDef(build_context, dockerfile))
+            self._build_services = build_services
+            self._build_services_by_dockerfile = {}
+            self._fixuid_configuration_paths = {}
+            for service in build_services:
+                dockerfile_path = os.path.abspath(os.path.join(service.context, service.dockerfile))
+                self._build_services_by_dockerfile.setdefault(dockerfile_path, []).append(service)
+                self._fixuid_configuration_paths[service] = os.path.join(service.context, "fixuid.yml")
+            self._build_services_source = self.docker_compose_config
+        return self._build_services
+
+    def _has_fixuid_configuration(self, service: BuildServiceDef):
+        # fixuid.yml may be created or deleted while watching, so its existence is never cached.
+        return os.path.isfile(self._fixuid_configuration_paths[service])
+
     def get_fixuid_services(self, include_missing_fixuid=False) -> Iterable[BuildServiceDef]:
         """
         Services where fixuid.tar.gz is available in build context.
         """
-        if "services" not in self.docker_compose_config:
-            return
-
-        for _, service in self.docker_compose_config.get("services").items():
-            if "build" not in service.keys():
+        for service in self._get_build_services():
+            if not include_missing_fixuid and not self._has_fixuid_configuration(service):
                 continue
-
-            if isinstance(service["build"], dict):
-                build_context = Dotty(service).get("build.context")
-            elif isinstance(service["build"], str):
-                build_context = service["build"]
-            else:
-                continue
-
-            if not include_missing_fixuid and not os.path.exists(os.path.join(build_context, "fixuid.yml")):
-                continue
-
-            dockerfile = Dotty(service).get("build.dockerfile", "Dockerfile")
-            yield BuildServiceDef(build_context, dockerfile)
+            yield service
 
     @staticmethod
     def _parse_entrypoint(entrypoint):
@@ -417,15 +562,21 @@ class FixuidDockerComposeAction(Action):
         if not entrypoint or entrypoint == "null":
             as_list = True
             entrypoint_list = []
+        elif isinstance(entrypoint, list):
+            as_list = True
+            entrypoint_list = list(entrypoint)
         elif entrypoint.startswith("["):
             as_list = True
             entrypoint_list = json.loads(entrypoint)
         else:
-            entrypoint_match = re.compile(r"^(['\"]?)(.*?)(['\"]?)$").match(entrypoint)
+            entrypoint_match = _entrypoint_quotes_regex.match(entrypoint)
             start_quote = entrypoint_match.group(1)
             end_quote = entrypoint_match.group(3)
             entrypoint = entrypoint_match.group(2)
-            entrypoint_list = shlex.split(entrypoint)
+            if _shlex_escape_regex.search(entrypoint):
+                entrypoint_list = shlex.split(entrypoint)
+            else:
+                entrypoint_list = entrypoint.split()
 
         return entrypoint_list, as_list, start_quote, end_quote
 
@@ -15,6 +15,8 @@ from ...config import config
 from ...utils.compat import path_as_posix_fast
 from ...utils.file import TemplateFinder
 
+_compose_name_invalid_chars_regex = re.compile(r'[^-_a-z0-9]')
+
 
 class JsonnetFeature(Feature):
     """
@@ -163,9 +165,14 @@ class JsonnetFeature(Feature):
         if port_prefix is None:
             project_name = config.data.get('core.project.name')
             if project_name:
-                port_prefix = int(hashlib.sha1(project_name.encode('utf-8')).hexdigest(), 16) % 655
+                # Keep sha1, as changing the algorithm would change default exposed ports of existing projects.
+                port_prefix = int.from_bytes(hashlib.sha1(project_name.encode('utf-8')).digest(), 'big') % 655
                 feature_config['docker.expose.port_prefix'] = port_prefix
 
+    @staticmethod
+    def _normalize_compose_name(name):
+        return _compose_name_invalid_chars_regex.sub('', name.lower()).replace('_', '-')
+
     @staticmethod
     def _configure_defaults_compose_project_name(feature_config):
         """
@@ -175,13 +182,10 @@ class JsonnetFeature(Feature):
         if compose_project_name is None:
             compose_project_name = feature_config.get('core.project.name')
 
-        def normalize_name(name):
-            return re.sub(r'[^-_a-z0-9]', '', name.lower()).replace('_', '-')
-
         if not compose_project_name:
             compose_project_name = os.path.basename(os.path.abspath(config.paths.project_home))
 
-        compose_project_name = normalize_name(compose_project_name)
+        compose_project_name = JsonnetFeature._normalize_compose_name(compose_project_name)
         feature_config['docker.compose.project_name'] = compose_project_name
         config.env_additions['COMPOSE_PROJECT_NAME'] = compose_project_name
 
@@ -189,7 +193,7 @@ class JsonnetFeature(Feature):
         if not compose_network_name:
             compose_network_name = compose_project_name + "-default"
 
-        compose_network_name = normalize_name(compose_network_name)
+        compose_network_name = JsonnetFeature._normalize_compose_name(compose_network_name)
         feature_config['docker.compose.network_name'] = compose_network_name
         config.env_additions['COMPOSE_NETWORK_NAME'] = compose_network_name
 
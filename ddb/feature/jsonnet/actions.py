@@ -3,9 +3,10 @@ import json
 import os
 import re
 from importlib import import_module
+from subprocess import CalledProcessError
+from tempfile import TemporaryDirectory
 from typing import Tuple, Union, Iterable, Optional
 
-import yaml
 from _jsonnet import evaluate_file  # pylint: disable=no-name-in-module
 
 from ddb.action.action import AbstractTemplateAction
@@ -13,6 +14,8 @@ from ddb.config import config, migrations
 from ddb.config.flatten import flatten
 from ddb.feature import features
 from ddb.utils.file import TemplateFinder, SingleTemporaryFile
+from ddb.utils.process import run
+from ddb.utils.compat import yaml_safe_dump
 
 
 class JsonnetAction(AbstractTemplateAction):
@@ -51,7 +54,7 @@ class JsonnetAction(AbstractTemplateAction):
             if ext.lower() in ['.yaml', '.yml']:
                 data = json.loads(evaluated)
                 self._do_postprocess(data)
-                evaluated = yaml.safe_dump(data)
+                evaluated = yaml_safe_dump(data)
             else:
                 if '__post_processors__' in evaluated:
                     data = json.loads(evaluated)
@@ -82,7 +85,8 @@ class JsonnetAction(AbstractTemplateAction):
                               target: str,
                               original_template: str,
                               render_error: Exception) -> Optional[str]:
-        property_name_match = re.match('RUNTIME ERROR: undefined external variable: (.*)\n', str(render_error))
+        property_name_match = re.match('RUNTIME ERROR: undefined external variable: (.*)\n', str(render_error),
+                                       re.IGNORECASE)
         if property_name_match:
             property_name = property_name_match.group(1)
 
@@ -122,12 +126,37 @@ class JsonnetAction(AbstractTemplateAction):
         ext_vars = {k: v for (k, v) in vars_config.items() if isinstance(v, str)}
         ext_codes = {k: str(v).lower() if isinstance(v, bool) else str(v) if v is not None else "null"
                      for (k, v) in codes_config.items() if not isinstance(v, str)}
+        jpathdir = os.path.join(os.path.dirname(__file__), "lib")
+
+        executable = config.data.get('jsonnet.executable')
+        if executable:
+            return JsonnetAction._evaluate_jsonnet_executable(executable, template_path, ext_vars, ext_codes, jpathdir)
+
         evaluated = evaluate_file(template_path,
                                   ext_vars=ext_vars,
                                   ext_codes=ext_codes,
-                                  jpathdir=os.path.join(os.path.dirname(__file__), "lib"))
+                                  jpathdir=jpathdir)
         return evaluated
 
+    @staticmethod
+    def _evaluate_jsonnet_executable(executable, template_path, ext_vars, ext_codes, jpathdir):
+        # External variables values are written to files, as they may contain secrets and command line length is
+        # limited.
+        with TemporaryDirectory(prefix="ddb-jsonnet-") as ext_dir:
+            args = ["-J", jpathdir]
+            for option, ext_values in (("--ext-str-file", ext_vars), ("--ext-code-file", ext_codes)):
+                for key, value in ext_values.items():
+                    ext_file = os.path.join(ext_dir, str(len(args)))
+                    with open(ext_file, "w", encoding="utf-8", newline="") as stream:
+                        stream.write(value)
+                    args.extend((option, "%s=%s" % (key, ext_file)))
+            args.append(template_path)
+
+            try:
+                return run(executable, *args).decode("utf-8")
+            except CalledProcessError as error:
+                raise RuntimeError(error.stderr.decode("utf-8", errors="replace")) from error
+
     @staticmethod
     def _parse_multiple_header(template_path, target_path):
         multiple_file_output = False
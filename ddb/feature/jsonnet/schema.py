@@ -146,4 +146,5 @@ class JsonnetSchema(FeatureSchema):
     extensions = fields.List(fields.String(), dump_default=[".*", ""])
     includes = fields.List(fields.String())  # default is build automatically from suffixes value
     excludes = fields.List(fields.String())
+    executable = fields.String(required=False, allow_none=True, dump_default=None)
     docker = fields.Nested(DockerSchema(), dump_default=DockerSchema())
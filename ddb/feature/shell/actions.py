@@ -3,10 +3,11 @@ import base64
 import json
 import os
 import shlex
-from typing import Iterable
+from functools import lru_cache
+from operator import itemgetter
+from typing import Iterable, Tuple, Union
 
 import zgitignore
-from dictdiffer import diff
 
 from .integrations import ShellIntegration
 from ...action import Action, actions
@@ -54,14 +55,23 @@ def encode_environ_backup(environ_backup: dict) -> str:
     """
     Encode environ backup into a safe string.
     """
-    return base64.b64encode(json.dumps(environ_backup).encode("utf-8")).decode("utf-8")
+    return base64.b64encode(json.dumps(environ_backup, separators=(',', ':')).encode("utf-8")).decode("ascii")
 
 
 def decode_environ_backup(encoded_environ_backup: str) -> dict:
     """
     Decode environ backup from safe string.
     """
-    return json.loads(base64.b64decode(encoded_environ_backup).decode("utf-8"))
+    return json.loads(base64.b64decode(encoded_environ_backup))
+
+
+def _is_never_ignored(_):
+    return False
+
+
+@lru_cache(maxsize=8)
+def _get_envignore_helper(envignore: Tuple[str, ...]):
+    return zgitignore.ZgitIgnore(envignore)
 
 
 def apply_diff_to_shell(shell: ShellIntegration,
@@ -71,51 +81,57 @@ def apply_diff_to_shell(shell: ShellIntegration,
     """
     Compute and apply environment diff for given shell, returning a list of shell instruction to run.
     """
-    variables = []
+    # os.environ encodes/decodes keys and values on each access, so a plain dict snapshot is used instead.
+    if not isinstance(source_environment, dict):
+        source_environment = dict(source_environment)
+    if not isinstance(target_environment, dict):
+        target_environment = dict(target_environment)
+
+    source_keys = source_environment.keys()
+    target_keys = target_environment.keys()
 
-    for (action, source, dest_items) in diff(source_environment, target_environment):
-        if action == 'add':
-            for (key, value) in dest_items:
-                variables.append((key, value))
-        if action == 'change':
-            variables.append((source, dest_items[1]))
-        if action == 'remove':
-            for (key, value) in dest_items:
-                variables.append((key, None))
+    variables = [(key, target_environment[key]) for key in target_keys - source_keys]
+    variables.extend((key, target_environment[key]) for key in source_keys & target_keys
+                     if source_environment[key] != target_environment[key])
+    variables.extend((key, None) for key in source_keys - target_keys)
 
-    envignore_helper = None
-    if envignore:
-        envignore_helper = zgitignore.ZgitIgnore(envignore)
+    is_ignored = _get_envignore_helper(tuple(envignore)).is_ignored if envignore else _is_never_ignored
+    remove_environment_variable = shell.remove_environment_variable
+    set_environment_variable = shell.set_environment_variable
 
-    for key, value in sorted(variables, key=lambda variable: variable[0]):
-        if not envignore_helper or not envignore_helper.is_ignored(key):
+    for key, value in sorted(variables, key=itemgetter(0)):
+        if not is_ignored(key):
             if value is None:
-                yield from shell.remove_environment_variable(key)
+                yield from remove_environment_variable(key)
             else:
-                yield from shell.set_environment_variable(key, value)
+                yield from set_environment_variable(key, value)
 
 
-def add_to_system_path(shell: ShellIntegration, paths: Iterable[str]) -> Iterable[str]:
+def add_to_system_path(shell: ShellIntegration, paths: Union[Iterable[str], str]) -> Iterable[str]:
     """
-    Add given path to system PATH environment variable
+    Add given paths to system PATH environment variable
     """
+    if isinstance(paths, str):
+        paths = [paths]
     system_path = os.environ.get('PATH', '')
-    for path in paths:
-        if config.data.get('shell.path.prepend'):
-            system_path = path + os.pathsep + system_path
-        else:
-            system_path = system_path + os.pathsep + path
+    if config.data.get('shell.path.prepend'):
+        system_path = os.pathsep.join([*reversed(list(paths)), system_path])
+    else:
+        system_path = os.pathsep.join([system_path, *paths])
 
     yield from shell.set_environment_variable('PATH', system_path)
 
 
-def remove_from_system_path(shell: ShellIntegration, paths: Iterable[str]) -> Iterable[str]:
+def remove_from_system_path(shell: ShellIntegration, paths: Union[Iterable[str], str]) -> Iterable[str]:
     """
-    Remove given path to system PATH environment variable
+    Remove given paths from system PATH environment variable
     """
+    if isinstance(paths, str):
+        paths = [paths]
     system_path = os.environ.get('PATH', '')
+    prepend = config.data.get('shell.path.prepend')
     for path in paths:
-        if config.data.get('shell.path.prepend'):
+        if prepend:
             system_path = system_path.replace(path + os.pathsep, "")
         else:
             system_path = system_path.replace(os.pathsep + path, "")
@@ -272,15 +288,19 @@ class ActivateAction(Action):
         except CheckIsNotActivatedException:
             pass
 
-        initial_environ = dict(os.environ.items())
-        config_environ = to_environ(config.data, config.env_prefix)
+        config_data = config.data
+        env_prefix = config.env_prefix
+
+        initial_environ = dict(os.environ)
+        config_environ = to_environ(config_data, env_prefix)
         config_environ.update(config.env_additions)
 
+        # Copy the snapshot, as shell may alter backup environment, and initial_environ is required to compute diff.
         to_encode_environ = dict(initial_environ)
         self.shell.before_environ_backup(to_encode_environ)
         os.environ.update(config_environ)
         os.environ[_env_environ_backup] = encode_environ_backup(to_encode_environ)
-        os.environ[config.env_prefix + '_PROJECT_HOME'] = config.paths.project_home
+        os.environ[env_prefix + '_PROJECT_HOME'] = config.paths.project_home
 
         with SingleTemporaryFile("ddb", "activate",
                                  mode='w',
@@ -295,14 +315,14 @@ class ActivateAction(Action):
                 self.shell,
                 initial_environ,
                 os.environ,
-                config.data.get('shell.envignore'))))
+                config_data.get('shell.envignore'))))
             file.write('\n')
 
-            path_directories = config.data.get('shell.path.directories')
+            path_directories = config_data.get('shell.path.directories')
             if path_directories:
-                path_additions = map(
-                    lambda path_addition: os.path.normpath(os.path.join(config.paths.project_home, path_addition)),
-                    path_directories)
+                project_home = config.paths.project_home
+                path_additions = [os.path.normpath(os.path.join(project_home, path_addition))
+                                  for path_addition in path_directories]
                 file.writelines('\n'.join(add_to_system_path(self.shell, path_additions)))
                 file.write('\n')
 
@@ -347,8 +367,9 @@ class DeactivateAction(Action):
         except CheckAnotherProjectActivatedException:
             pass
 
-        if os.environ.get(_env_environ_backup):
-            environ_backup = decode_environ_backup(os.environ[_env_environ_backup])
+        encoded_environ_backup = os.environ.get(_env_environ_backup)
+        if encoded_environ_backup:
+            environ_backup = decode_environ_backup(encoded_environ_backup)
 
             with SingleTemporaryFile("ddb", "deactivate",
                                      mode='w',
@@ -4,13 +4,13 @@ import re
 import tempfile
 from typing import Union, Iterable, Tuple, Optional
 
-import yaml
 
 from ddb.action.action import AbstractTemplateAction
 from ddb.config import config, migrations
 from ddb.config.migrations import AbstractPropertyMigration
 from ddb.utils.file import TemplateFinder, SingleTemporaryFile
 from ddb.utils.process import run
+from ddb.utils.compat import yaml_safe_dump
 
 
 class YttAction(AbstractTemplateAction):
@@ -50,7 +50,7 @@ class YttAction(AbstractTemplateAction):
         return new
 
     def _render_template(self, template: str, target: str) -> Iterable[Tuple[Union[str, bytes, bool], str]]:
-        yaml_config = yaml.safe_dump(YttAction._escape_config(config.data.raw()))
+        yaml_config = yaml_safe_dump(YttAction._escape_config(config.data.raw()))
 
         includes = TemplateFinder.build_default_includes_from_suffixes(
             config.data["ytt.depends_suffixes"],
@@ -68,7 +68,7 @@ class Registry(Generic[T]):
         Set a cache provider, and register cached entries into registry.
         """
         self._cache = cache
-        if self._cache:
+        if self._cache is not None:
             for key in self._cache.keys():
                 self._register_cache_value_impl(self._cache.get(key), key)
 
@@ -104,7 +104,7 @@ class Registry(Generic[T]):
         self._objects_dict[name] = obj
         self._objects.append(obj)
 
-        if self._cache and obj and (name not in self._cache or self._cache.get(name) != obj):
+        if self._cache is not None and obj and (name not in self._cache or self._cache.get(name) != obj):
             self._cache.set(name, obj)
             self._cache.flush()
 
@@ -137,7 +137,7 @@ class Registry(Generic[T]):
             self._objects_dict.pop(name)
             self._objects.remove(item)
 
-            if self._cache and name in self._cache:
+            if self._cache is not None and name in self._cache:
                 self._cache.pop(name)
 
             if callback:
@@ -164,9 +164,10 @@ class Registry(Generic[T]):
         """
         Remove all object instances.
         """
-        self._objects_dict.clear()
-        self._objects.clear()
-        if self._cache:
+        if self._objects or self._objects_dict:
+            self._objects_dict.clear()
+            self._objects.clear()
+        if self._cache is not None:
             self._cache.clear()
 
     def close(self):
@@ -174,7 +175,7 @@ class Registry(Generic[T]):
         Close this registry, closing the underlying cache if defined and then removing all objects instances.
         :return:
         """
-        if self._cache:
+        if self._cache is not None:
             self._cache.close()
             self._cache = None
         self.clear()
@@ -199,7 +200,7 @@ class RegistryOrderedSet(Registry):
         items.add(obj)
         self._objects.append(obj)
 
-        if self._cache:
+        if self._cache is not None:
             self._cache.set(name, items)
             self._cache.flush()
 
@@ -219,10 +220,10 @@ class RegistryOrderedSet(Registry):
             if ret:
                 if not items:
                     self._objects_dict.pop(name)
-                    if self._cache and name in self._cache:
+                    if self._cache is not None and name in self._cache:
                         self._cache.pop(name)
                 else:
-                    if self._cache:
+                    if self._cache is not None:
                         self._cache.set(name, items)
         return ret
 
@@ -1,5 +1,12 @@
 import re
 
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader, SafeDumper  # type: ignore
+
 _windows_drive_letter_regex = re.compile(r"^([a-zA-Z]):")
 _windows_posix_drive_letter_regex = re.compile(r"^/([a-z])(/|$)")
 
@@ -19,3 +26,17 @@ def posix_as_path_fast(posix_path: str):
     replaced = _windows_posix_drive_letter_regex.sub(lambda match: match.group(1).upper() + ':' + match.group(2),
                                                      posix_path)
     return replaced.replace('/', '\\')
+
+
+def yaml_safe_load(stream):
+    """
+    Parse a YAML stream with the safe loader, using libyaml when available.
+    """
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def yaml_safe_dump(data, stream=None, **kwargs):
+    """
+    Serialize data to YAML with the safe dumper, using libyaml when available.
+    """
+    return yaml.dump(data, stream, Dumper=SafeDumper, **kwargs)
@@ -117,14 +117,27 @@ class DockerComposePlugin:
                                             "instead of calling 'docker-compose up'")
 
     @classmethod
-    def project_from_options_for_each_dir(cls, dirs, *args, **kwargs):
+    def worker_options(cls, project_dir, options):
+        """
+        Use a distinct project name for each pytest-xdist worker, so workers don't share the same containers.
+        """
+        worker = os.environ.get("PYTEST_XDIST_WORKER")
+        if not worker or options.get("--project-name"):
+            return options
+        options = dict(options)
+        options["--project-name"] = os.path.basename(os.path.abspath(project_dir)) + "_" + worker
+        return options
+
+    @classmethod
+    def project_from_options_for_each_dir(cls, dirs, options):
         """
         Create the Docker project from options, trying each project_dirs.
         """
         exc = None
         for project_dir in dirs:
             try:
-                project = project_from_options(project_dir=project_dir, *args, **kwargs)
+                project = project_from_options(project_dir=project_dir,
+                                               options=cls.worker_options(project_dir, options))
                 return project, project_dir
             except ComposeFileNotFound as local_exc:
                 exc = local_exc
@@ -221,7 +234,7 @@ class DockerComposePlugin:
                 project_key = '|'.join(files)
                 project = project_from_options(
                     project_dir=str(project_dir),
-                    options={"--file": files},
+                    options=cls.worker_options(project_dir, {"--file": files}),
                 )
             else:
                 project, project_key = cls.project_from_options_for_each_dir(basedirs, options={})
@@ -37,10 +37,8 @@ install_requires = [
     "deepmerge",
     "diskcache",
     "python-slugify",
-    "dictdiffer",
     "Jinja2",
     "braceexpand",
-    "toposort",
     "cookiecutter",
     "jsonnet-binary",
     "zgitignore",
@@ -75,6 +73,7 @@ dev_requires = [
     "coverage",
     "waiting",
     "pytest-mock",
+    "pytest-xdist",
     "pytest-cov",
     "pytest-benchmark",
     "pytest-profiling",
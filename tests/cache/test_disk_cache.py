@@ -0,0 +1,89 @@
+import os
+
+import pytest
+from _pytest.fixtures import FixtureRequest
+
+from ddb.cache.disk_cache import DiskCache
+
+
+class TestDiskCacheAdapter:
+    def test_should_raise_value_error_after_close(self, request: FixtureRequest):
+        adapter = DiskCache(request.node.name)
+        adapter.close()
+
+        with pytest.raises(ValueError):
+            adapter.set("foo", "bar")
+
+        with pytest.raises(ValueError):
+            adapter.get("foo")
+
+        with pytest.raises(ValueError):
+            len(adapter)
+
+    def test_should_return_keys_as_list(self, request: FixtureRequest):
+        adapter = DiskCache(request.node.name)
+        adapter.clear()
+        adapter.set("foo", "bar")
+        adapter.set("bar", "foo")
+
+        keys = adapter.keys()
+        assert isinstance(keys, list)
+        assert sorted(keys) == ["bar", "foo"]
+        assert len(adapter) == 2
+
+        adapter.close()
+
+    def test_should_raise_key_error_on_missing_pop(self, request: FixtureRequest):
+        adapter = DiskCache(request.node.name)
+        adapter.clear()
+        adapter.set("foo", None)
+
+        assert adapter.pop("foo") is None
+        with pytest.raises(KeyError):
+            adapter.pop("foo")
+
+        adapter.close()
+
+    def test_should_persist_clear_across_instances(self, request: FixtureRequest):
+        adapter = DiskCache(request.node.name)
+        adapter.set("foo", "bar")
+        adapter.flush()
+        adapter.close()
+
+        adapter = DiskCache(request.node.name)
+        assert adapter.get("foo") == "bar"
+        adapter.clear()
+        adapter.flush()
+        adapter.close()
+
+        adapter = DiskCache(request.node.name)
+        assert adapter.get("foo") is None
+        assert len(adapter) == 0
+        adapter.close()
+
+    def test_should_share_values_with_opened_instance(self, request: FixtureRequest):
+        adapter = DiskCache(request.node.name)
+        adapter.clear()
+        other = DiskCache(request.node.name)
+
+        adapter.set("foo", "bar")
+        assert other.get("foo") == "bar"
+        assert "foo" in other
+
+        other.close()
+        adapter.close()
+
+    def test_should_recover_from_corrupted_directory(self, request: FixtureRequest):
+        adapter = DiskCache(request.node.name)
+        adapter.set("foo", "bar")
+        adapter.close()
+
+        with open(os.path.join(adapter.directory, "cache.db"), "wb") as stream:
+            stream.write(b"garbage" * 1024)
+
+        adapter = DiskCache(request.node.name)
+        assert adapter.get("foo") is None
+
+        adapter.set("foo", "bar")
+        assert adapter.get("foo") == "bar"
+        adapter.close()
@@ -49,3 +49,14 @@ class TestShelveAdapter:
 
         adapter = ShelveCache(request.node.name)
         assert adapter.get("foo") is None
+
+    def test_should_count_values_properly(self, request: FixtureRequest):
+        adapter = ShelveCache(request.node.name)
+        adapter.clear()
+        assert len(adapter) == 0
+
+        adapter.set("foo", "bar")
+        adapter.set("bar", "foo")
+        assert len(adapter) == 2
+
+        adapter.close()
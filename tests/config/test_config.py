@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
 import os
 
+import pytest
 import yaml
 from ddb.config import Config
 from ddb.config.flatten import flatten
+from ddb.config.merger import config_merger
 
 
 def test_defaults():
@@ -81,3 +83,54 @@ def test_flatten(data_dir):
     assert ret == {'empty_tags': [], 'tags': ['test'], 'app.another': 'value', 'app.some.empty_tags2': [],
                    'app.some.tags2': ['test2.a', 2],
                    'app.some.complex_list[0]': 'simple', 'app.some.complex_list[1].key': 'value'}
+
+
+@pytest.mark.skipif("os.name == 'nt'")
+def test_load_ignores_dangling_symlink(tmp_path):
+    Config.defaults = None
+    Config.overrides = None
+
+    with open(os.path.join(str(tmp_path), 'ddb.yml'), 'w') as stream:
+        stream.write('some: value\n')
+    os.symlink(os.path.join(str(tmp_path), 'missing.yml'), os.path.join(str(tmp_path), 'ddb.local.yml'))
+
+    config = Config(paths=(str(tmp_path),))
+    data, files = config.read()
+
+    assert data == {'some': 'value'}
+    assert list(files.keys()) == [os.path.join(str(tmp_path), 'ddb.yml')]
+
+
+def test_read_after_clear_cache(tmp_path):
+    Config.defaults = None
+    Config.overrides = None
+
+    filepath = os.path.join(str(tmp_path), 'ddb.yml')
+    with open(filepath, 'w') as stream:
+        stream.write('some: foo\n')
+    stat = os.stat(filepath)
+
+    config = Config(paths=(str(tmp_path),))
+    data, _ = config.read()
+    assert data == {'some': 'foo'}
+
+    with open(filepath, 'w') as stream:
+        stream.write('some: bar\n')
+    # Same size and mtime, as if the file was modified within the same timestamp tick.
+    os.utime(filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    config.clear_files_cache()
+    data, _ = config.read()
+    assert data == {'some': 'bar'}
+
+
+@pytest.mark.parametrize("base,nxt,expected", [
+    ({'a': {'b': 1}}, {'a': {'c': 2}}, {'a': {'b': 1, 'c': 2}}),
+    ({'a': [1]}, {'a': {'merge': 'append', 'value': [2]}}, {'a': [1, 2]}),
+    ({'merge': 'override', 'value': {'merge': []}}, {'value': {'value': {'a': 1}}},
+     {'merge': 'override', 'value': {'a': 1}}),
+    ({'a': {'merge': 'override'}}, {'a': {'value': {'b': 1}}}, {'a': {'b': 1}}),
+])
+def test_merge_value_dicts(base, nxt, expected):
+    assert config_merger.merge(base, nxt) == expected
+
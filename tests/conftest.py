@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
 import os
 import shutil
+import sys
+import tempfile
 import zipfile
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Optional, List
 
 import pytest
 from _pytest.fixtures import FixtureRequest
@@ -34,13 +36,49 @@ def data_dir(global_data_dir: str, request: FixtureRequest) -> str:
 
 
 @pytest.fixture()
-def project_loader(data_dir: str, tmp_path_factory: TempPathFactory, request: FixtureRequest) -> Callable[
-    [Optional[str]], Config]:
+def tmpfs_dirs() -> List[str]:
+    """
+    Temporary directories on tmpfs created during the test. They are removed after configure fixture teardown, as
+    caches stored inside are still opened until reset.
+    """
+    dirs = []
+    yield dirs
+    for tmpfs_dir in dirs:
+        shutil.rmtree(tmpfs_dir, ignore_errors=True)
+
+
+def _tmpfs_dir(tmpfs_dirs: List[str]) -> Optional[Path]:
+    """
+    Temporary directory on tmpfs, as projects are made of many small files.
+    """
+    if not sys.platform.startswith('linux') or not os.path.isdir('/dev/shm') or not os.access('/dev/shm', os.W_OK):
+        return None
+    tmpfs_dir = tempfile.mkdtemp(prefix="ddb-tests-", dir='/dev/shm')
+    tmpfs_dirs.append(tmpfs_dir)
+    return Path(tmpfs_dir)
+
+
+def _numbered_path(parent: Path, basename: str) -> Path:
+    # Same naming as TempPathFactory.mktemp, as project name is deduced from project directory.
+    index = 0
+    while (parent / (basename + str(index))).exists():
+        index += 1
+    return parent / (basename + str(index))
+
+
+@pytest.fixture()
+def project_loader(data_dir: str, tmp_path_factory: TempPathFactory, tmpfs_dirs: List[str],
+                   request: FixtureRequest) -> Callable[[Optional[str]], Config]:
+    tmpfs_dir = _tmpfs_dir(tmpfs_dirs)
+
     def load(name: str = None, before_load_config=None, config_provider=init_config_paths):
         root_dir = os.path.join(data_dir, name) if name else data_dir
 
-        tmp_path = tmp_path_factory.mktemp(request.function.__name__)  # type: Path
-        tmp_path.rmdir()
+        if tmpfs_dir:
+            tmp_path = _numbered_path(tmpfs_dir, request.function.__name__)
+        else:
+            tmp_path = tmp_path_factory.mktemp(request.function.__name__)  # type: Path
+            tmp_path.rmdir()
         shutil.copytree(root_dir, str(tmp_path))
 
         os.chdir(str(tmp_path))
@@ -59,7 +97,7 @@ def project_loader(data_dir: str, tmp_path_factory: TempPathFactory, request: Fi
 
 
 @pytest.fixture(autouse=True)
-def configure(mocker: MockerFixture):
+def configure(mocker: MockerFixture, tmpfs_dirs: List[str]):
     original_environ = dict(os.environ)
     cwd = os.getcwd()
 
@@ -116,4 +154,9 @@ def pytest_configure(config):
         def showfspath(self):
             return False
 
+        @showfspath.setter
+        def showfspath(self, value):
+            # pytest-xdist sets this attribute, but it should stay disabled.
+            pass
+
     terminal.TerminalReporter = QuietReporter
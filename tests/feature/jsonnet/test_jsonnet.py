@@ -1,6 +1,8 @@
 import os
 import pathlib
 import re
+import stat
+import sys
 
 import pytest
 import yaml
@@ -15,6 +17,43 @@ from ddb.feature.file import FileFeature, FileWalkAction
 from ddb.feature.jsonnet import JsonnetFeature
 from ddb.utils.compat import path_as_posix_fast
 
+_jsonnet_executable_stub = """#!%s
+import sys
+
+from _jsonnet import evaluate_file
+
+with open(sys.argv[0] + ".args", "w") as args_file:
+    args_file.write("\\n".join(sys.argv[1:]))
+
+ext_vars = {}
+ext_codes = {}
+jpathdir = None
+args = iter(sys.argv[1:])
+for arg in args:
+    if arg == "-J":
+        jpathdir = next(args)
+    elif arg in ("--ext-str-file", "--ext-code-file"):
+        key, filepath = next(args).split("=", 1)
+        with open(filepath, "r") as ext_file:
+            (ext_vars if arg == "--ext-str-file" else ext_codes)[key] = ext_file.read()
+    else:
+        template_path = arg
+
+try:
+    sys.stdout.write(evaluate_file(template_path, ext_vars=ext_vars, ext_codes=ext_codes, jpathdir=jpathdir))
+except RuntimeError as error:
+    sys.stderr.write("STUB " + str(error))
+    sys.exit(1)
+"""
+
+
+def _write_jsonnet_executable_stub(directory):
+    executable = os.path.join(str(directory), "jsonnet")
+    with open(executable, "w") as f:
+        f.write(_jsonnet_executable_stub % (sys.executable,))
+    os.chmod(executable, os.stat(executable).st_mode | stat.S_IXUSR)
+    return executable
+
 
 class TestJsonnetAction:
     def test_empty_project_without_core(self, project_loader):
@@ -239,6 +278,62 @@ class TestJsonnetAction:
 
         assert variables == variables_expected
 
+    @pytest.mark.skipif("os.name == 'nt'")
+    def test_config_variables_executable(self, project_loader, tmp_path):
+        project_loader("config_variables")
+
+        features.register(CoreFeature())
+        features.register(FileFeature())
+        features.register(JsonnetFeature())
+        load_registered_features()
+        register_actions_in_event_bus(True)
+
+        executable = _write_jsonnet_executable_stub(tmp_path)
+        config.data['jsonnet.executable'] = executable
+
+        action = FileWalkAction()
+        action.initialize()
+        action.execute()
+
+        assert os.path.exists('variables.json')
+        with open('variables.json', 'r') as f:
+            variables = f.read()
+
+        with open('variables.expected.json', 'r') as f:
+            variables_expected = f.read()
+
+        assert variables == variables_expected
+
+        with open(executable + ".args", 'r') as f:
+            args = f.read().splitlines()
+
+        assert "--ext-str-file" in args
+        assert "--ext-code-file" in args
+        assert "testDeep" not in args
+        assert "some.deep.nested.variable" not in os.environ
+
+    @pytest.mark.skipif("os.name == 'nt'")
+    def test_executable_error(self, project_loader, tmp_path):
+        project_loader("config_variables")
+
+        features.register(CoreFeature())
+        features.register(FileFeature())
+        features.register(JsonnetFeature())
+        load_registered_features()
+        register_actions_in_event_bus(True)
+
+        with open('invalid.json.jsonnet', 'w') as f:
+            f.write('{ invalid: std.extVar("missing.variable") }')
+
+        config.data['jsonnet.executable'] = _write_jsonnet_executable_stub(tmp_path)
+
+        action = FileWalkAction()
+        action.initialize()
+        with pytest.raises(RuntimeError, match="STUB .*missing.variable"):
+            action.execute()
+
+        assert not os.path.exists('invalid.json')
+
     @pytest.mark.parametrize("variant", [
         "test-dev",
         "test-ci",
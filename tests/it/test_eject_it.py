@@ -5,7 +5,16 @@ import yaml
 
 from ddb.__main__ import main
 from ddb.config import config
-from tests.utilstest import expect_gitignore, setup_cfssl
+from ddb.utils.compat import SafeLoader
+from tests.utilstest import read_gitignore_block, setup_cfssl
+
+
+def load_expected_docker_compose(filepath):
+    with open(filepath, 'r') as expected_dc_file:
+        expected_data = expected_dc_file.read()
+    expected_data = expected_data.replace("%network_name%",
+                                          str(config.data.get('jsonnet.docker.compose.network_name')))
+    return yaml.load(expected_data, SafeLoader)
 
 
 class TestEject:
@@ -17,36 +26,36 @@ class TestEject:
 
         main(["configure"])
 
+        gitignore = read_gitignore_block(".gitignore")
+
         assert os.path.exists("docker-compose.yml")
         assert os.path.exists("docker-compose.yml.jsonnet")
-        assert expect_gitignore(".gitignore", "/docker-compose.yml")
+        assert "/docker-compose.yml" in gitignore
 
         assert os.path.exists(os.path.join(".bin", "psql" + (".bat" if os.name == "nt" else "")))
-        assert expect_gitignore(".gitignore", "/.bin/psql" + (".bat" if os.name == "nt" else ""))
+        assert "/.bin/psql" + (".bat" if os.name == "nt" else "") in gitignore
 
         assert os.path.exists(os.path.join(".docker", "db", "Dockerfile.jinja"))
-        assert expect_gitignore(".gitignore", "/.docker/db/Dockerfile")
+        assert "/.docker/db/Dockerfile" in gitignore
 
         main(["configure", "--eject"], reset_disabled=True)
 
+        gitignore = read_gitignore_block(".gitignore")
+
         assert os.path.exists("docker-compose.yml")
         assert not os.path.exists("docker-compose.yml.jsonnet")
-        assert not expect_gitignore(".gitignore", "/docker-compose.yml")
+        assert "/docker-compose.yml" not in gitignore
 
         assert os.path.exists(os.path.join(".bin", "psql" + (".bat" if os.name == "nt" else "")))
-        assert expect_gitignore(".gitignore", "/.bin/psql" + (".bat" if os.name == "nt" else ""))
+        assert "/.bin/psql" + (".bat" if os.name == "nt" else "") in gitignore
 
         assert not os.path.exists(os.path.join(".docker", "db", "Dockerfile.jinja"))
-        assert not expect_gitignore(".gitignore", "/.docker/db/Dockerfile")
+        assert "/.docker/db/Dockerfile" not in gitignore
 
         with open('docker-compose.yml', 'r') as dc_file:
-            actual = yaml.load(dc_file, yaml.SafeLoader)
+            actual = yaml.load(dc_file, SafeLoader)
 
-        with open('../expected/docker-compose.yml', 'r') as expected_dc_file:
-            expected_data = expected_dc_file.read()
-            expected_data = expected_data.replace("%network_name%",
-                                                  str(config.data.get('jsonnet.docker.compose.network_name')))
-            expected = yaml.load(expected_data, yaml.SafeLoader)
+        expected = load_expected_docker_compose('../expected/docker-compose.yml')
 
         assert actual == expected
 
@@ -58,36 +67,36 @@ class TestEject:
 
         main(["configure"])
 
+        gitignore = read_gitignore_block(".gitignore")
+
         assert os.path.exists("docker-compose.yml")
         assert os.path.exists("docker-compose.yml.jsonnet")
-        assert expect_gitignore(".gitignore", "/docker-compose.yml")
+        assert "/docker-compose.yml" in gitignore
 
         assert os.path.exists(os.path.join(".bin", "psql" + (".bat" if os.name == "nt" else "")))
-        assert expect_gitignore(".gitignore", "/.bin/psql" + (".bat" if os.name == "nt" else ""))
+        assert "/.bin/psql" + (".bat" if os.name == "nt" else "") in gitignore
 
         assert os.path.exists(os.path.join(".docker", "db", "Dockerfile.jinja"))
-        assert expect_gitignore(".gitignore", "/.docker/db/Dockerfile")
+        assert "/.docker/db/Dockerfile" in gitignore
 
         main(["configure", "--eject"], reset_disabled=True)
 
+        gitignore = read_gitignore_block(".gitignore")
+
         assert os.path.exists("docker-compose.yml")
         assert not os.path.exists("docker-compose.yml.jsonnet")
-        assert not expect_gitignore(".gitignore", "/docker-compose.yml")
+        assert "/docker-compose.yml" not in gitignore
 
         assert os.path.exists(os.path.join(".bin", "psql" + (".bat" if os.name == "nt" else "")))
-        assert expect_gitignore(".gitignore", "/.bin/psql" + (".bat" if os.name == "nt" else ""))
+        assert "/.bin/psql" + (".bat" if os.name == "nt" else "") in gitignore
 
         assert not os.path.exists(os.path.join(".docker", "db", "Dockerfile.jinja"))
-        assert not expect_gitignore(".gitignore", "/.docker/db/Dockerfile")
+        assert "/.docker/db/Dockerfile" not in gitignore
 
         with open('docker-compose.yml', 'r') as dc_file:
-            actual = yaml.load(dc_file, yaml.SafeLoader)
+            actual = yaml.load(dc_file, SafeLoader)
 
-        with open('../expected/docker-compose.yml', 'r') as expected_dc_file:
-            expected_data = expected_dc_file.read()
-            expected_data = expected_data.replace("%network_name%",
-                                                  str(config.data.get('jsonnet.docker.compose.network_name')))
-            expected = yaml.load(expected_data, yaml.SafeLoader)
+        expected = load_expected_docker_compose('../expected/docker-compose.yml')
 
         assert actual == expected
 
@@ -99,38 +108,38 @@ class TestEject:
 
         main(["configure"])
 
+        gitignore = read_gitignore_block(".gitignore")
+
         assert os.path.exists("docker-compose.yml")
         assert os.path.exists("docker-compose.yml.jsonnet")
-        assert expect_gitignore(".gitignore", "/docker-compose.yml")
+        assert "/docker-compose.yml" in gitignore
 
         assert os.path.exists(os.path.join(".bin", "psql" + (".bat" if os.name == "nt" else "")))
-        assert expect_gitignore(".gitignore", "/.bin/psql" + (".bat" if os.name == "nt" else ""))
+        assert "/.bin/psql" + (".bat" if os.name == "nt" else "") in gitignore
 
         assert os.path.exists(os.path.join(".docker", "db", "Dockerfile.jinja"))
-        assert expect_gitignore(".gitignore", "/.docker/db/Dockerfile")
+        assert "/.docker/db/Dockerfile" in gitignore
 
         os.environ['DDB_OVERRIDE_JSONNET_DOCKER_VIRTUALHOST_DISABLED'] = "1"
         os.environ['DDB_OVERRIDE_JSONNET_DOCKER_BINARY_DISABLED'] = "True"
         main(["configure", "--eject"], reset_disabled=True)
 
+        gitignore = read_gitignore_block(".gitignore")
+
         assert os.path.exists("docker-compose.yml")
         assert not os.path.exists("docker-compose.yml.jsonnet")
-        assert not expect_gitignore(".gitignore", "/docker-compose.yml")
+        assert "/docker-compose.yml" not in gitignore
 
         assert not os.path.exists(os.path.join(".bin", "psql" + (".bat" if os.name == "nt" else "")))
-        assert not expect_gitignore(".gitignore", "/.bin/psql" + (".bat" if os.name == "nt" else ""))
+        assert "/.bin/psql" + (".bat" if os.name == "nt" else "") not in gitignore
 
         assert not os.path.exists(os.path.join(".docker", "db", "Dockerfile.jinja"))
-        assert not expect_gitignore(".gitignore", "/.docker/db/Dockerfile")
+        assert "/.docker/db/Dockerfile" not in gitignore
 
         with open('docker-compose.yml', 'r') as dc_file:
-            actual = yaml.load(dc_file, yaml.SafeLoader)
+            actual = yaml.load(dc_file, SafeLoader)
 
-        with open('../expected/docker-compose.jsonnet.disabled.yml', 'r') as expected_dc_file:
-            expected_data = expected_dc_file.read()
-            expected_data = expected_data.replace("%network_name%",
-                                                  str(config.data.get('jsonnet.docker.compose.network_name')))
-            expected = yaml.load(expected_data, yaml.SafeLoader)
+        expected = load_expected_docker_compose('../expected/docker-compose.jsonnet.disabled.yml')
 
         assert actual == expected
 
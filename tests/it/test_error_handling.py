@@ -3,6 +3,11 @@ from _pytest.logging import LogCaptureFixture
 from ddb.__main__ import main
 from ddb.config import Config
 
+INVALID_JSONNET_MESSAGE = ('An unexpected error has occured '
+                           '[phase:configure => FileWalkAction.execute(), '
+                           'file:found => JsonnetAction.execute(target=invalid, template=invalid.jsonnet)]: '
+                           'STATIC ERROR: invalid.jsonnet:1:1-9: Unknown variable: trololol')
+
 
 class TestErrorHandling:
     def test_invalid_jsonnet(self, project_loader, caplog: LogCaptureFixture):
@@ -16,8 +21,4 @@ class TestErrorHandling:
         assert len(caplog.records) >= 1
         record = caplog.records[0]
 
-        assert record.message == \
-               'An unexpected error has occured ' + \
-               '[phase:configure => FileWalkAction.execute(), ' + \
-               'file:found => JsonnetAction.execute(target=invalid, template=invalid.jsonnet)]: ' + \
-               'STATIC ERROR: invalid.jsonnet:1:1-9: Unknown variable: trololol'
+        assert record.message == INVALID_JSONNET_MESSAGE
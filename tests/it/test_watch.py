@@ -155,7 +155,8 @@ class TestWatch:
 
 
 def copy_from_files(f):
-    with NamedTemporaryFile('w', delete=False) as tmp:
+    # Temporary file is created next to source files, as rename can't move it to another filesystem.
+    with NamedTemporaryFile('w', delete=False, dir=os.path.join("..", "files")) as tmp:
         with open(os.path.join("..", "files", f)) as source:
             shutil.copyfileobj(source, tmp)
 
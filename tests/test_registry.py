@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 import pytest
+from _pytest.fixtures import FixtureRequest
 
 from ddb.binary.binary import DefaultBinary, Binary
+from ddb.cache.disk_cache import DiskCache
 from ddb.feature.docker.binaries import DockerBinary
 from ddb.registry import Registry, DefaultRegistryObject, RegistryOrderedSet
 
@@ -119,6 +121,28 @@ class TestRegistry:
             r.register(n)
         assert str(e.value) == "Name should be provided to register this kind of object"
 
+    def test_register_in_empty_cache(self, request: FixtureRequest):
+        cache = DiskCache(request.node.name)
+        cache.clear()
+
+        r = Registry(Dummy, "Dummy")
+        r.set_cache(cache)
+
+        d = Dummy("dummy")
+        r.register(d)
+
+        assert len(cache) == 1
+        assert cache.get("dummy").name == "dummy"
+
+        r.close()
+
+        cache = DiskCache(request.node.name)
+        r = Registry(Dummy, "Dummy")
+        r.set_cache(cache)
+
+        assert r.get("dummy").name == "dummy"
+        r.close()
+
 
 class TestRegistrySet:
     def test_empty(self):
@@ -179,6 +203,28 @@ class TestRegistrySet:
         assert r.get("dummy") == {d, d3}
         assert r.all() == (d, d3)
 
+    def test_register_in_empty_cache(self, request: FixtureRequest):
+        cache = DiskCache(request.node.name)
+        cache.clear()
+
+        r = RegistryOrderedSet(HashbableDummy, "HashbableDummy")
+        r.set_cache(cache)
+
+        d = HashbableDummy("dummy", "1", "2")
+        r.register(d)
+
+        assert len(cache) == 1
+        assert cache.get("dummy") == {d}
+
+        r.close()
+
+        cache = DiskCache(request.node.name)
+        r = RegistryOrderedSet(HashbableDummy, "HashbableDummy")
+        r.set_cache(cache)
+
+        assert r.get("dummy") == {d}
+        r.close()
+
     def test_unregistered(self):
         r = RegistryOrderedSet(HashbableDummy, "HashbableDummy")
 
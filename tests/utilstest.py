@@ -33,6 +33,9 @@ def init_config_paths(data_dir: str = None, name: str = None):
     return config
 
 
+_ready_cfssl_containers = set()
+
+
 def _get_docker_ip():
     docker_host = os.environ.get('DOCKER_HOST')
     if not docker_host:
@@ -66,10 +69,23 @@ def setup_cfssl(container_getter):
 
     config.defaults.update(config.data)
 
-    _wait_cfssl_ready()
+    # config is reset after each test, but cfssl container is module scoped and has only to be waited once.
+    if cfssl_service.id not in _ready_cfssl_containers:
+        _wait_cfssl_ready()
+        _ready_cfssl_containers.add(cfssl_service.id)
 
 
 def expect_gitignore(gitignore: str, *expected_lines: str):
+    in_block_lines = read_gitignore_block(gitignore)
+
+    for expected_line in expected_lines:
+        if expected_line not in in_block_lines:
+            return False
+
+    return True
+
+
+def read_gitignore_block(gitignore: str):
     in_block_lines = set()
 
     if os.path.exists(gitignore):
@@ -85,11 +101,7 @@ def expect_gitignore(gitignore: str, *expected_lines: str):
                 if inside_block:
                     in_block_lines.add(gitignore_line)
 
-    for expected_line in expected_lines:
-        if expected_line not in in_block_lines:
-            return False
-
-    return True
+    return in_block_lines
 
 
 def get_user_uid_gid(username):